@@ -0,0 +1,775 @@
+import asyncio
+import time
+import tracemalloc
+import unittest
+from unittest import mock
+
+from PythonProject5 import Lista2_zadanie2, Lista2_stats
+from PythonProject5.Lista2_zadanie1 import Wielomian
+from PythonProject5.Lista2_zadanie2 import (DNASequence, RNASequence, ProteinSequence, read_fasta,
+                                            merge_kmer_counts)
+from PythonProject5.Lista2_store import SequenceStore
+from PythonProject5.Lista2_batch import process_batch, process_fasta
+from PythonProject5.Lista2_stats import gc_content, gc_skew, at_skew, shannon_entropy
+from PythonProject5.Lista2_async import read_fasta_async, transcribe_translate_pipeline
+from PythonProject5 import Lista2_profiling
+from PythonProject5 import Lista2_benchmark
+from PythonProject5.Lista2_minhash import MinHash, LSHIndex, deduplicate, find_similar_pairs
+from PythonProject5.Lista2_protein import (molecular_weight, isoelectric_point, composition, hydropathy,
+                                          protein_profile, RESIDUES)
+
+"""
+@author Emilia Romanowska
+
+Źródła:
+- Dokumentacja Python: https://docs.python.org/3/reference/index.html
+- Wsparcie koncepcyjne i techniczne: ChatGPT
+"""
+
+
+class TestMutacjeBufora(unittest.TestCase):
+    """Testy mutacji na buforze bytearray i migawek copy-on-write."""
+
+    def test_apply_mutations(self):
+        """Test nakładania wielu mutacji punktowych."""
+        dna = DNASequence("ref", "AAAAAA")
+        dna.apply_mutations([(0, 'C'), (3, 'g'), (5, 'T')])
+        self.assertEqual(dna.data, "CAAGAT")
+
+    def test_apply_mutations_atomowe(self):
+        """Test atomowości apply_mutations przy błędnej pozycji."""
+        dna = DNASequence("ref", "AAAA")
+        with self.assertRaises(IndexError):
+            dna.apply_mutations([(0, 'C'), (10, 'G')])
+        self.assertEqual(dna.data, "AAAA")
+
+    def test_snapshot_copy_on_write(self):
+        """Test niezależności migawek copy-on-write od oryginału."""
+        ref = DNASequence("ref", "ATGCATGC")
+        hap1 = ref.snapshot("hap1")
+        hap2 = ref.snapshot("hap2")
+
+        hap1.mutate(0, 'G')
+        hap2.apply_mutations([(1, 'A'), (2, 'A')])
+
+        self.assertEqual(ref.data, "ATGCATGC")
+        self.assertEqual(hap1.data, "GTGCATGC")
+        self.assertEqual(hap2.data, "AAACATGC")
+        self.assertEqual(hap1.identifier, "hap1")
+
+    def test_haplotypy_wspoldziela_referencje(self):
+        """Test współdzielenia bufora referencji przez zmutowane haplotypy."""
+        ref = DNASequence("ref", "ACGT" * 250_000)
+        tracemalloc.start()
+        try:
+            hap1 = ref.snapshot("hap1")
+            hap2 = ref.snapshot("hap2")
+            hap1.apply_mutations([(0, 'T'), (100, 'T')])
+            hap2.mutate(5, 'A')
+            ref.mutate(1, 'A')
+            zajete = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+        # Warianty trafiają do nakładek - żaden z 1 MB buforów nie został skopiowany
+        self.assertLess(zajete, 100_000)
+        self.assertEqual(hap1[0], "T")
+        self.assertEqual(hap1[-1], "T")
+        self.assertEqual(hap2[5], "A")
+
+        self.assertEqual(hap1.data[:8], "TCGTACGT")
+        self.assertEqual(hap1.data[100], "T")
+        self.assertEqual(hap2.data[:8], "ACGTAAGT")
+        self.assertEqual(ref.data[:8], "AAGTACGT")
+        self.assertEqual(ref.snapshot().data, ref.data)
+
+    def test_data_nie_jest_zapamietywane(self):
+        """Test braku zapamiętywania napisu data po odczycie."""
+        dna = DNASequence("d", "ACGT" * 10_000)
+        tracemalloc.start()
+        try:
+            self.assertEqual(len(dna.data), 40_000)
+            self.assertTrue(str(dna).startswith(">d\nACGT"))
+            zatrzymane = tracemalloc.get_traced_memory()[0]
+        finally:
+            tracemalloc.stop()
+        self.assertLess(zatrzymane, 4_000)
+
+    def test_translacja_z_bufora(self):
+        """Test translacji uwzględniającej mutacje bufora."""
+        rna = RNASequence("r", "AUGGCCUUUUAAGGG")
+        self.assertEqual(rna.translate().data, "MAF")
+        rna.mutate(1, 'C')
+        self.assertEqual(rna.translate().data, "TAF")
+
+    def test_duza_nakladka_scalana(self):
+        """Test scalania dużej nakładki we własny bufor haplotypu."""
+        ref = DNASequence("ref", "A" * 128)
+        hap = ref.snapshot("hap")
+        hap.apply_mutations([(0, 'C'), (1, 'C'), (2, 'C')])
+        self.assertEqual(hap.data, "CCC" + "A" * 125)
+        self.assertEqual(ref.data, "A" * 128)
+
+        # Po scaleniu obie sekwencje dalej mutują się niezależnie
+        ref.mutate(3, 'G')
+        hap.mutate(4, 'T')
+        self.assertEqual(hap.data, "CCCAT" + "A" * 123)
+        self.assertEqual(ref.data, "AAAG" + "A" * 124)
+
+
+class TestNormalizacjaBajtowa(unittest.TestCase):
+    """Testy jednoprzebiegowej normalizacji i walidacji na bajtach."""
+
+    def test_normalizacja_bajtow(self):
+        """Test normalizacji danych podanych jako bajty."""
+        self.assertEqual(DNASequence("b", b"at gc\n").data, "ATGC")
+
+    def test_pierwsza_niepoprawna_pozycja(self):
+        """Test zgłaszania pierwszego niepoprawnego znaku i jego pozycji."""
+        with self.assertRaises(ValueError) as ctx:
+            DNASequence("test", "at g\ncXAX")
+        self.assertIn("'X'", str(ctx.exception))
+        self.assertIn("pozycji 4", str(ctx.exception))
+
+    def test_znak_spoza_ascii(self):
+        """Test odrzucania znaków spoza ASCII."""
+        with self.assertRaises(ValueError) as ctx:
+            DNASequence("test", "AT ĆG")
+        self.assertIn("pozycji 2", str(ctx.exception))
+
+    def test_normalizacja_fragmentami(self):
+        """Test normalizacji i walidacji na granicach fragmentów."""
+        with mock.patch.object(Lista2_zadanie2, '_NORMALIZE_CHUNK', 4):
+            self.assertEqual(DNASequence("f", "ac gt\nAC\tgtA").data, "ACGTACGTA")
+            self.assertEqual(DNASequence("f", memoryview(b"ac gt\nAC")).data, "ACGTAC")
+            with self.assertRaises(ValueError) as ctx:
+                DNASequence("f", "ac gt\nACĆ")
+            self.assertIn("pozycji 6", str(ctx.exception))
+            with self.assertRaises(ValueError) as ctx:
+                DNASequence("f", "ac gt\nACN")
+            self.assertIn("pozycji 6", str(ctx.exception))
+
+    def test_szczyt_pamieci_normalizacji(self):
+        """Test szczytowego zużycia pamięci przy normalizacji dużych danych."""
+        dane = "acgt" * 2_000_000
+        tracemalloc.start()
+        try:
+            DNASequence("duza", dane)
+            szczyt = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        # Wynik (8 MB) + kilka fragmentów, bez dodatkowej pełnej kopii
+        self.assertLess(szczyt, 12_000_000)
+
+
+class TestWidokiSekwencji(unittest.TestCase):
+    """Testy wycinków bez kopiowania i leniwych widoków."""
+
+    def setUp(self):
+        """Przygotowanie danych testowych."""
+        self.dna = DNASequence("chr1", "ATGCCGTA")
+
+    def test_indeks_i_wycinek(self):
+        """Test indeksowania i wycinków zwracających widok."""
+        self.assertEqual(self.dna[0], "A")
+        self.assertEqual(self.dna[-1], "A")
+        fragment = self.dna[2:6]
+        self.assertEqual(len(fragment), 4)
+        self.assertEqual(fragment.data, "GCCG")
+        self.assertEqual(fragment.identifier, "chr1[2:6]")
+
+    def test_widok_jest_stabilny(self):
+        """Test niezmienności widoku po mutacji sekwencji."""
+        fragment = self.dna[2:6]
+        self.dna.mutate(2, 'A')
+        self.assertEqual(fragment.data, "GCCG")
+        self.assertEqual(self.dna.data, "ATACCGTA")
+
+    def test_widok_stabilny_po_migawce(self):
+        """Test stabilności widoku przy migawkach i mutacjach."""
+        kopia = self.dna.snapshot("kopia")
+        fragment = self.dna[0:4]
+        self.dna.mutate(0, 'C')
+        kopia.mutate(1, 'C')
+        self.assertEqual(fragment.data, "ATGC")
+        self.assertEqual(self.dna.data, "CTGCCGTA")
+        self.assertEqual(kopia.data, "ACGCCGTA")
+
+    def test_pusty_i_odwrocony_wycinek(self):
+        """Test pustych i odwróconych wycinków."""
+        with self.assertRaises(ValueError):
+            self.dna[5:2].materialize()
+        odwrocony = self.dna[::-1]
+        self.assertEqual(odwrocony.identifier, "chr1[7::-1]")
+        self.assertEqual(odwrocony.materialize().data, "ATGCCGTA")
+        self.assertEqual(self.dna[6:2:-2].identifier, "chr1[6:2:-2]")
+        self.assertEqual(self.dna[::-2].data, "AGCT")
+
+    def test_wycinek_z_nakladka(self):
+        """Test wycinków sekwencji z niescaloną nakładką mutacji."""
+        kopia = self.dna.snapshot("kopia")
+        kopia.apply_mutations([(1, 'C'), (6, 'G')])
+        fragment = kopia[0:4]
+        kopia.mutate(2, 'T')
+        self.assertEqual(fragment.data, "ACGC")
+        self.assertEqual(fragment.identifier, "kopia[0:4]")
+        self.assertEqual(kopia[::-3].data, "ACC")
+        self.assertEqual(kopia[::-3].identifier, "kopia[7::-3]")
+        self.assertEqual(len(kopia[4:1]), 0)
+        self.assertEqual(kopia.data, "ACTCCGGA")
+        self.assertEqual(self.dna.data, "ATGCCGTA")
+
+    def test_mutacje_i_wycinki_naprzemiennie(self):
+        """Test naprzemiennych mutacji i wycinków bez kopiowania całej sekwencji."""
+        dna = DNASequence("duza", "ACGT" * 1_000_000)
+        dna.view()
+        tracemalloc.start()
+        try:
+            for i in range(200):
+                dna.mutate(i * 1000, 'A')
+                self.assertEqual(dna[i * 1000:i * 1000 + 100].data[0], "A")
+            szczyt = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        # Każdy wycinek kopiuje tylko swój zakres, a nie 4 MB sekwencji
+        self.assertLess(szczyt, 400_000)
+
+    def test_leniwa_komplementarnosc_i_transkrypcja(self):
+        """Test leniwej komplementarności i transkrypcji widoku."""
+        widok = self.dna.complement_view()[1:4]
+        self.assertEqual(widok[0], "A")
+        self.assertEqual(widok.data, "ACG")
+
+        rna = self.dna.transcribe_view().materialize()
+        self.assertIsInstance(rna, RNASequence)
+        self.assertEqual(rna, self.dna.transcribe())
+
+    def test_komplementarnosc_tylko_dla_dna(self):
+        """Test odrzucania komplementarności dla widoku RNA."""
+        with self.assertRaises(TypeError):
+            self.dna.transcribe_view().complement_view()
+
+
+class TestSequenceStore(unittest.TestCase):
+    """Testy kolumnowego magazynu sekwencji."""
+
+    def setUp(self):
+        """Przygotowanie danych testowych."""
+        self.store = SequenceStore()
+        self.store.append("r1", "acgt")
+        self.store.add(DNASequence("r2", "GGCC"))
+        self.store.extend([("r3", "TTTA")])
+
+    def test_rekordy(self):
+        """Test dostępu do rekordów magazynu."""
+        self.assertEqual(len(self.store), 3)
+        rekord = self.store[1]
+        self.assertEqual(rekord.identifier, "r2")
+        self.assertEqual(rekord.data, "GGCC")
+        self.assertEqual(len(rekord), 4)
+        self.assertEqual(rekord[1:3].data, "GC")
+        self.assertEqual(self.store[-1].findMotif("TA"), 2)
+        self.assertEqual(rekord, DNASequence("r2", "GGCC"))
+
+    def test_rownosc_symetryczna(self):
+        """Test symetrycznego porównywania rekordów i sekwencji."""
+        rekord = self.store[1]
+        sekwencja = DNASequence("r2", "GGCC")
+        self.assertTrue(rekord == sekwencja)
+        self.assertTrue(sekwencja == rekord)
+        self.assertFalse(sekwencja != rekord)
+        self.assertTrue(self.store[1] == rekord)
+        self.assertFalse(rekord == self.store[0])
+        self.assertFalse(sekwencja == "GGCC")
+        self.assertFalse(rekord == "GGCC")
+
+    def test_find_motif_w_granicach_rekordu(self):
+        """Test wyszukiwania motywu tylko w obrębie rekordu."""
+        # "GTG" występuje tylko na styku r1 ("ACGT") i r2 ("GGCC")
+        self.assertEqual(self.store[0].findMotif("GTG"), -1)
+        self.assertEqual(self.store[1].findMotif("CC"), 2)
+        self.assertEqual(self.store[0].findMotif("A"), 0)
+
+    def test_wycinek_nie_blokuje_magazynu(self):
+        """Test dopisywania do magazynu przy istniejącym wycinku."""
+        fragment = self.store[0][0:2]
+        self.store.append("r4", "GATTACA")
+        self.assertEqual(fragment.data, "AC")
+        self.assertEqual(self.store[3].data, "GATTACA")
+
+    def test_zgodnosc_z_dna(self):
+        """Test zgodności operacji rekordu z DNASequence."""
+        rekord = self.store[0]
+        self.assertEqual(rekord.complement().data, "TGCA")
+        self.assertEqual(rekord.transcribe().data, "ACGU")
+        self.assertEqual(str(rekord), ">r1\nACGT")
+
+    def test_walidacja(self):
+        """Test walidacji dopisywanych sekwencji."""
+        with self.assertRaises(ValueError):
+            self.store.append("zly", "ACGU")
+
+    def test_bajty_na_odczyt(self):
+        """Test średniego zużycia pamięci na odczyt."""
+        self.assertGreater(self.store.bytes_per_read(), 4)
+        self.assertEqual(SequenceStore().bytes_per_read(), 0.0)
+
+    def test_sloty(self):
+        """Test braku słownika atrybutów w sekwencjach."""
+        self.assertFalse(hasattr(DNASequence("x", "A"), "__dict__"))
+
+
+class TestPrzetwarzanieWsadowe(unittest.TestCase):
+    """Testy równoległego przetwarzania paczek sekwencji."""
+
+    def setUp(self):
+        """Przygotowanie danych testowych."""
+        self.sekwencje = [DNASequence(f"s{i}", "ATGGAA" + "ACG" * i + "TAA") for i in range(20)]
+        self.oczekiwane = [s.transcribe().translate() for s in self.sekwencje]
+
+    def test_kolejnosc_zachowana(self):
+        """Test zachowania kolejności wyników paczek."""
+        wyniki = list(process_batch(self.sekwencje, max_workers=2, chunk_size=3))
+        self.assertEqual(wyniki, self.oczekiwane)
+
+    def test_bez_kolejnosci_i_bez_pamieci_wspoldzielonej(self):
+        """Test przetwarzania bez kolejności i bez pamięci współdzielonej."""
+        wyniki = list(process_batch(self.sekwencje, max_workers=2, chunk_size=4,
+                                    ordered=False, use_shared_memory=False))
+        klucz = lambda s: s.identifier
+        self.assertEqual(sorted(wyniki, key=klucz), sorted(self.oczekiwane, key=klucz))
+
+    def test_strumien_fasta(self):
+        """Test przetwarzania strumienia FASTA."""
+        linie = "\n".join(str(s) for s in self.sekwencje[:5]).splitlines()
+        self.assertEqual(list(read_fasta(linie)), self.sekwencje[:5])
+        self.assertEqual(list(process_fasta(linie, max_workers=2)), self.oczekiwane[:5])
+
+    def test_nieznany_etap(self):
+        """Test natychmiastowej walidacji argumentów."""
+        # Błąd zgłaszany od razu przy wywołaniu, bez iterowania wyników
+        with self.assertRaises(ValueError):
+            process_batch(self.sekwencje, stages=['reverse'])
+        with self.assertRaises(ValueError):
+            process_batch(self.sekwencje, chunk_size=0)
+        with self.assertRaises(ValueError):
+            process_batch(self.sekwencje, max_workers=0)
+        with self.assertRaises(ValueError):
+            process_fasta([], stages=['reverse'])
+
+
+class TestKmery(unittest.TestCase):
+    """Testy zliczania k-merów kroczącym haszem 2-bitowym."""
+
+    def test_zliczanie(self):
+        """Test zliczania k-merów."""
+        dna = DNASequence("x", "ACGTACGA")
+        self.assertEqual(dna.kmer_counts(3), {"ACG": 2, "CGT": 1, "GTA": 1, "TAC": 1, "CGA": 1})
+        self.assertEqual(len(list(dna.kmer_iter(3))), 6)
+        self.assertEqual(dna.kmer_counts(9), {})
+
+    def test_kanoniczne(self):
+        """Test zliczania k-merów kanonicznych."""
+        # ACG i jego odwrotny komplement CGT to ten sam k-mer kanoniczny
+        dna = DNASequence("x", "ACGT")
+        self.assertEqual(dna.kmer_counts(3, canonical=True), {"ACG": 2})
+
+    def test_rna_i_dekodowanie(self):
+        """Test k-merów RNA i dekodowania kodów."""
+        rna = RNASequence("r", "UUUGA")
+        self.assertEqual(rna.kmer_counts(4), {"UUUG": 1, "UUGA": 1})
+        self.assertEqual(RNASequence.decode_kmer(0b11100100, 4), "UGCA")
+
+    def test_laczenie_licznikow(self):
+        """Test łączenia liczników z wielu sekwencji."""
+        wynik = merge_kmer_counts([DNASequence("a", "AAAC"), DNASequence("b", "AAG")], 2)
+        self.assertEqual(wynik, {"AA": 3, "AC": 1, "AG": 1})
+
+    def test_laczenie_dna_i_rna(self):
+        """Test odrzucania mieszanki DNA i RNA bez kodów liczbowych."""
+        sekwencje = [DNASequence("a", "ACGT"), RNASequence("b", "ACGU")]
+        with self.assertRaises(TypeError):
+            merge_kmer_counts(sekwencje, 2)
+        wynik = merge_kmer_counts(sekwencje, 2, encoded=True)
+        self.assertEqual(wynik, {0b0001: 2, 0b0110: 2, 0b1011: 2})
+
+    def test_bledne_k(self):
+        """Test natychmiastowej walidacji długości k-meru."""
+        # Błąd zgłaszany od razu przy wywołaniu, bez iterowania k-merów
+        with self.assertRaises(ValueError):
+            DNASequence("x", "ACGT").kmer_iter(0)
+
+
+class TestStatystykiOkien(unittest.TestCase):
+    """Testy statystyk składu w oknach przesuwnych."""
+
+    def setUp(self):
+        """Przygotowanie danych testowych."""
+        self.dna = DNASequence("x", "GGGCCCATATACGT")
+
+    def test_gc_content(self):
+        """Test zawartości GC w oknach."""
+        self.assertEqual(list(gc_content(self.dna, 4, 2)), [1.0, 1.0, 0.5, 0.0, 0.25, 0.5])
+
+    def test_skosnosc(self):
+        """Test skośności GC i AT w oknach."""
+        self.assertEqual(list(gc_skew(self.dna, 4, 2)), [0.5, -0.5, -1.0, 0.0, -1.0, 0.0])
+        self.assertEqual(list(at_skew(self.dna.transcribe(), 4, 5)), [0.0, 1 / 3, 0.0])
+
+    def test_entropia(self):
+        """Test entropii Shannona w oknach."""
+        self.assertEqual(list(shannon_entropy("ACGT", 4)), [2.0])
+        self.assertEqual(list(shannon_entropy(ProteinSequence("p", "MMMM"), 2)), [0.0, 0.0, 0.0])
+
+    def test_wiele_blokow(self):
+        """Test zgodności wyników przy podziale okien na wiele bloków."""
+        dane = "GGGCCCATATACGTTTAGCA" * 5
+        okno, krok = 7, 3
+        poczatki = range(0, len(dane) - okno + 1, krok)
+        oczekiwane_gc = [sum(z in "GC" for z in dane[s:s + okno]) / okno for s in poczatki]
+        oczekiwana_entropia = list(shannon_entropy(dane, okno, krok))
+        with mock.patch.object(Lista2_stats, '_BLOCK', 4):
+            for wynik, oczekiwany in zip(gc_content(dane, okno, krok), oczekiwane_gc):
+                self.assertAlmostEqual(wynik, oczekiwany)
+            self.assertEqual(list(shannon_entropy(dane, okno, krok)), oczekiwana_entropia)
+        self.assertEqual(len(oczekiwana_entropia), len(poczatki))
+
+    def test_czas_niezalezny_od_okna(self):
+        """Test czasu liczenia statystyk niezależnego od rozmiaru okna."""
+        dane = Lista2_benchmark.generate_sequence(200_000, seed=5)
+
+        def czas(okno):
+            najlepszy = float('inf')
+            for _ in range(2):
+                start = time.perf_counter()
+                gc_content(dane, okno)
+                najlepszy = min(najlepszy, time.perf_counter() - start)
+            return najlepszy
+
+        # Duże okno daje o połowę mniej okien, więc nie może liczyć się dłużej -
+        # także przy wielu małych blokach, gdzie koszt O(w) na blok byłby widoczny
+        with mock.patch.object(Lista2_stats, '_BLOCK', 1 << 10):
+            self.assertLess(czas(100_000), czas(10))
+
+    def test_widok_i_bledne_okno(self):
+        """Test statystyk widoku i walidacji rozmiaru okna."""
+        self.assertEqual(list(gc_content(self.dna[6:10], 2, 2)), [0.0, 0.0])
+        with self.assertRaises(ValueError):
+            gc_content(self.dna, 100)
+
+
+class TestPrzyblizonyMotyw(unittest.TestCase):
+    """Testy przybliżonego wyszukiwania motywów."""
+
+    def setUp(self):
+        """Przygotowanie danych testowych."""
+        self.dna = DNASequence("x", "AACGTTACGATT")
+
+    def test_hamming(self):
+        """Test wyszukiwania z odległością Hamminga."""
+        trafienia = list(self.dna.findMotifApprox("ACGT", 1, metric='hamming'))
+        self.assertEqual(trafienia, [(1, 0), (6, 1)])
+
+    def test_edycyjna(self):
+        """Test wyszukiwania z odległością edycyjną."""
+        # ACGT z usuniętym T: ACG występuje na pozycji 6 z jednym błędem
+        trafienia = list(self.dna.findMotifApprox("ACGAT", 1))
+        self.assertEqual(trafienia, [(1, 1), (6, 0)])
+
+    def test_edycyjna_bez_powtorzen(self):
+        """Test zgłaszania każdego wystąpienia tylko raz."""
+        # Jedno wystąpienie zgłaszane raz, z najlepszą odległością
+        dna = DNASequence("x", "ACGTACGT")
+        self.assertEqual(list(dna.findMotifApprox("ACGT", 2)), [(0, 0), (4, 0)])
+        dna = DNASequence("x", "TTACGTTTTACCTTT")
+        self.assertEqual(list(dna.findMotifApprox("ACGT", 1)), [(2, 0), (9, 1)])
+        # Sąsiednie dokładne wystąpienia to osobne trafienia
+        dna = DNASequence("x", "AGATTTTCATATT")
+        self.assertEqual(list(dna.findMotifApprox("TT", 0)), [(3, 0), (4, 0), (5, 0), (11, 0)])
+
+    def test_dlugi_motyw(self):
+        """Test wyszukiwania motywu dłuższego niż słowo maszynowe."""
+        motyw = "ACGT" * 20
+        dna = DNASequence("dlugi", "TT" + motyw[:40] + "G" + motyw[41:] + "TT")
+        self.assertEqual(list(dna.findMotifApprox(motyw, 1)), [(2, 1)])
+        self.assertEqual(list(dna.findMotifApprox(motyw, 1, metric='hamming')), [(2, 1)])
+
+    def test_bledne_argumenty(self):
+        """Test natychmiastowej walidacji argumentów."""
+        with self.assertRaises(ValueError):
+            self.dna.findMotifApprox("ACGT", -1)
+        with self.assertRaises(ValueError):
+            self.dna.findMotifApprox("ACGT", 1, metric='levenshtein')
+
+
+class TestPotokAsynchroniczny(unittest.TestCase):
+    """Testy asynchronicznego potoku FASTA -> transkrypcja -> translacja -> FASTA."""
+
+    class Odbiorca:
+        """Prosty odbiorca zapisujący bajty do pamięci."""
+
+        def __init__(self):
+            """Konstruktor odbiorcy."""
+            self.bufor = bytearray()
+
+        def write(self, dane):
+            """Dopisuje dane do bufora."""
+            self.bufor += dane
+
+        async def drain(self):
+            """Symuluje opróżnienie bufora zapisu."""
+            await asyncio.sleep(0)
+
+    @staticmethod
+    async def linie(tekst):
+        """Zamienia tekst na asynchroniczny strumień linii w bajtach."""
+        for linia in tekst.splitlines(keepends=True):
+            yield linia.encode('utf-8')
+
+    def setUp(self):
+        """Przygotowanie danych testowych."""
+        self.fasta = "".join(f">s{i}\nATGGAA\nACG{'ACG' * i}TAA\n" for i in range(10))
+
+    def test_wiele_strumieni(self):
+        """Test równoległego przetwarzania wielu strumieni przez jeden potok."""
+        potok = transcribe_translate_pipeline(maxsize=2)
+        odbiorcy = [self.Odbiorca() for _ in range(3)]
+
+        async def uruchom():
+            await asyncio.gather(*(potok.run(read_fasta_async(self.linie(self.fasta)), odbiorca)
+                                   for odbiorca in odbiorcy))
+
+        asyncio.run(uruchom())
+        wynik = list(read_fasta(odbiorcy[0].bufor.decode('utf-8').splitlines(), ProteinSequence))
+        self.assertEqual(len(wynik), 10)
+        self.assertEqual(wynik[1], ProteinSequence("s1_RNA_protein", "METT"))
+        self.assertTrue(all(odbiorca.bufor == odbiorcy[0].bufor for odbiorca in odbiorcy))
+
+        metryki = potok.metrics()
+        self.assertEqual(metryki['translate']['processed'], 30)
+        self.assertEqual(set(metryki), {'read', 'transcribe', 'translate', 'write'})
+
+    def test_czytnik_zgodny_z_read_fasta(self):
+        """Test zgodności czytnika asynchronicznego z read_fasta."""
+        async def wczytaj(tekst):
+            return [sekwencja async for sekwencja in read_fasta_async(self.linie(tekst))]
+
+        tekst = self.fasta + "\n>ostatnia\nAC\nGT"
+        self.assertEqual(asyncio.run(wczytaj(tekst)), list(read_fasta(tekst.splitlines())))
+        with self.assertRaises(ValueError):
+            asyncio.run(wczytaj("ACGT\n>x\nA\n"))
+
+    def test_identyfikator_spoza_ascii(self):
+        """Test identyfikatorów ze znakami spoza ASCII."""
+        potok = transcribe_translate_pipeline()
+        odbiorca = self.Odbiorca()
+        asyncio.run(potok.run(read_fasta_async(self.linie(">gen_żółw\nATGGAATAA\n")), odbiorca))
+        self.assertEqual(odbiorca.bufor.decode('utf-8'), ">gen_żółw_RNA_protein\nME\n")
+
+    def test_blad_etapu(self):
+        """Test przekazania błędu etapu do wywołującego."""
+        potok = transcribe_translate_pipeline()
+        with self.assertRaises(ValueError):
+            asyncio.run(potok.run(read_fasta_async(self.linie(">x\nATGA\n")), self.Odbiorca()))
+
+
+class TestProfilowanie(unittest.TestCase):
+    """Testy opcjonalnej instrumentacji metod."""
+
+    def setUp(self):
+        """Przygotowanie danych testowych."""
+        Lista2_profiling.reset()
+
+    def tearDown(self):
+        """Wyłączenie instrumentacji po teście."""
+        Lista2_profiling.disable()
+
+    def test_liczniki(self):
+        """Test liczników wywołań i rozmiarów wejścia."""
+        with Lista2_profiling.profiled():
+            dna = DNASequence("a", "ATGGAATAA")
+            dna.transcribe().translate()
+            Wielomian([1, 2]) * Wielomian([1, 1])
+
+        dane = Lista2_profiling.snapshot()
+        self.assertEqual(dane["DNASequence.transcribe"]["calls"], 1)
+        self.assertEqual(dane["DNASequence.transcribe"]["input_size"], 9)
+        self.assertEqual(dane["Wielomian.__mul__"]["calls"], 1)
+        self.assertEqual(dane["Wielomian.__init__"]["calls"], 3)
+        self.assertGreaterEqual(dane["RNASequence.translate"]["total_seconds"], 0.0)
+
+    def test_wylaczone_bez_kosztu(self):
+        """Test przywracania oryginalnych metod po wyłączeniu."""
+        oryginal = DNASequence.__dict__["transcribe"]
+        Lista2_profiling.enable()
+        self.assertIsNot(DNASequence.__dict__["transcribe"], oryginal)
+        Lista2_profiling.disable()
+        self.assertIs(DNASequence.__dict__["transcribe"], oryginal)
+
+        DNASequence("a", "ATG").transcribe()
+        self.assertEqual(Lista2_profiling.snapshot(), {})
+
+    def test_eksport_prometheus(self):
+        """Test eksportu metryk w formacie Prometheus."""
+        with Lista2_profiling.profiled(track_memory=True):
+            DNASequence("a", "ATGC").complement()
+        tekst = Lista2_profiling.to_prometheus()
+        self.assertIn("# TYPE lista2_calls_total counter", tekst)
+        self.assertIn('lista2_calls_total{method="DNASequence.complement"} 1', tekst)
+
+
+class TestBenchmark(unittest.TestCase):
+    """Testy zestawu benchmarków (na najmniejszych danych)."""
+
+    def test_rozmiary(self):
+        """Test parsowania rozmiarów danych."""
+        self.assertEqual(Lista2_benchmark.parse_size("1k"), 1000)
+        self.assertEqual(Lista2_benchmark.parse_size("2M"), 2_000_000)
+        self.assertEqual(Lista2_benchmark.parse_size("1Gb"), 10 ** 9)
+
+    def test_generowanie_powtarzalne(self):
+        """Test powtarzalności generowanych danych."""
+        dane = Lista2_benchmark.generate_sequence(1000, seed=3)
+        self.assertEqual(dane, Lista2_benchmark.generate_sequence(1000, seed=3))
+        self.assertTrue(set(dane) <= set(b"ACGT"))
+        rna = RNASequence("r", Lista2_benchmark.generate_coding_rna(300))
+        self.assertEqual(len(rna.translate()), 100)
+
+    def test_przebieg_i_regresje(self):
+        """Test przebiegu benchmarków i wykrywania regresji."""
+        wyniki = Lista2_benchmark.run_benchmarks([1000], ['construct', 'transcribe'], repeat=1)
+        self.assertEqual([w['operation'] for w in wyniki], ['construct', 'transcribe'])
+        self.assertTrue(all(w['rate'] > 0 and w['peak_bytes'] >= 0 for w in wyniki))
+
+        odniesienie = {f"{w['operation']}@{w['size']}": {'rate': w['rate'] * 10, 'peak_bytes': None}
+                       for w in wyniki}
+        self.assertEqual(len(Lista2_benchmark.find_regressions(wyniki, odniesienie)), 2)
+
+    def test_dane_tylko_dla_wybranych_operacji(self):
+        """Test generowania danych tylko dla wybranych operacji."""
+        generuj = Lista2_benchmark.generate_sequence
+        with mock.patch.object(Lista2_benchmark, 'generate_sequence', side_effect=generuj) as licznik:
+            Lista2_benchmark.run_benchmarks([1000], ['transcribe'], repeat=1, measure_memory=False)
+        self.assertEqual(licznik.call_count, 1)
+
+    def test_kodujace_rna_przeplatane(self):
+        """Test generowania RNA złożonego z kodonów sensownych."""
+        rna = Lista2_benchmark.generate_coding_rna(3000, seed=1)
+        kodony = {rna[i:i + 3] for i in range(0, len(rna), 3)}
+        self.assertEqual(len(rna), 3000)
+        self.assertTrue(kodony <= set(Lista2_benchmark._SENSE_CODONS))
+
+
+class TestDeduplikacjaIMinHash(unittest.TestCase):
+    """Testy skrótów zawartości, szkiców MinHash i indeksu LSH."""
+
+    def setUp(self):
+        """Przygotowanie danych testowych."""
+        self.baza = "ATGCGTACGTTAGCCGATCGATCGGCTAGCTAGGCTTACGATCGATGCATGCAAGT" * 3
+        self.zmutowana = self.baza[:80] + "T" + self.baza[81:]
+        self.inna = "GGGCCCAAATTT" * 14
+
+    def test_skrot_zawartosci(self):
+        """Test skrótu zawartości i jego unieważniania po mutacji."""
+        a = DNASequence("a", self.baza)
+        b = DNASequence("b", self.baza)
+        self.assertEqual(a.content_digest(), b.content_digest())
+        skrot = a.content_digest()
+        a.mutate(0, 'C')
+        self.assertNotEqual(a.content_digest(), skrot)
+
+    def test_deduplikacja(self):
+        """Test usuwania sekwencji o identycznej zawartości."""
+        sekwencje = [DNASequence("a", self.baza), DNASequence("b", self.baza), DNASequence("c", self.inna)]
+        self.assertEqual([s.identifier for s in deduplicate(sekwencje)], ["a", "c"])
+
+    def test_minhash_jaccard(self):
+        """Test szacowania podobieństwa Jaccarda szkicami MinHash."""
+        a = MinHash.from_sequence(DNASequence("a", self.baza))
+        b = MinHash.from_sequence(DNASequence("b", self.zmutowana))
+        c = MinHash.from_sequence(DNASequence("c", self.inna))
+        self.assertGreater(a.jaccard(b), 0.6)
+        self.assertLess(a.jaccard(c), 0.2)
+
+    def test_krotka_sekwencja_i_walidacja(self):
+        """Test szkicu krótkiej sekwencji i walidacji k."""
+        # Mniej k-merów niż kubełków - puste kubełki wypełnia densyfikacja
+        a = MinHash.from_sequence(ProteinSequence("p", "MKVLAAGIT"), k=3, num_perm=64)
+        b = MinHash.from_sequence(ProteinSequence("q", "MKVLAAGIT"), k=3, num_perm=64)
+        self.assertEqual(len(a), 64)
+        self.assertEqual(a.jaccard(b), 1.0)
+        self.assertEqual(len(set(a.signature)), len(a))
+        with self.assertRaises(ValueError):
+            MinHash.from_sequence(ProteinSequence("p", "MKV"), k=0)
+
+    def test_indeks_lsh(self):
+        """Test wyszukiwania podobnych szkiców w indeksie LSH."""
+        indeks = LSHIndex(num_perm=128, bands=32)
+        indeks.insert("a", MinHash.from_sequence(DNASequence("a", self.baza)))
+        indeks.insert("c", MinHash.from_sequence(DNASequence("c", self.inna)))
+        wynik = indeks.query_similar(MinHash.from_sequence(DNASequence("b", self.zmutowana)), 0.5)
+        self.assertEqual([klucz for klucz, _ in wynik], ["a"])
+        with self.assertRaises(ValueError):
+            LSHIndex(num_perm=128, bands=30)
+
+    def test_pary_podobnych(self):
+        """Test wyszukiwania par podobnych sekwencji."""
+        sekwencje = [DNASequence("a", self.baza), DNASequence("b", self.zmutowana), DNASequence("c", self.inna)]
+        pary = [(x, y) for x, y, _ in find_similar_pairs(sekwencje, threshold=0.5)]
+        self.assertEqual(pary, [("a", "b")])
+
+
+class TestProfilBialka(unittest.TestCase):
+    """Testy profilu fizykochemicznego białek."""
+
+    def setUp(self):
+        """Przygotowanie danych testowych."""
+        self.insulina = ProteinSequence("insB", "FVNQHLCGSHLVEALYLVCGERGFFYTPKT")
+        self.lizyna = ProteinSequence("polyK", "KKKKKKKKKK")
+        self.kwasne = ProteinSequence("polyD", "DDDDDDDDDD")
+
+    def test_masa_czasteczkowa(self):
+        """Test masy cząsteczkowej białka i kolekcji."""
+        self.assertAlmostEqual(molecular_weight(self.insulina), 3429.96, places=1)
+        self.assertAlmostEqual(molecular_weight(ProteinSequence("g", "G")), 75.07, places=2)
+        masy = molecular_weight([self.insulina, self.lizyna])
+        self.assertEqual(len(masy), 2)
+        self.assertAlmostEqual(masy[0], molecular_weight(self.insulina))
+
+    def test_punkt_izoelektryczny(self):
+        """Test punktu izoelektrycznego białek i rekordów magazynu."""
+        self.assertGreater(isoelectric_point(self.lizyna), 10)
+        self.assertLess(isoelectric_point(self.kwasne), 4)
+        magazyn = SequenceStore(ProteinSequence)
+        magazyn.extend([self.lizyna, self.kwasne])
+        wynik = isoelectric_point(magazyn)
+        self.assertGreater(wynik[0], wynik[1])
+        self.assertAlmostEqual(isoelectric_point(magazyn[0]), isoelectric_point(self.lizyna))
+
+    def test_sklad(self):
+        """Test składu aminokwasowego."""
+        sklad = composition(ProteinSequence("p", "AAGX"))
+        self.assertEqual(len(sklad), len(RESIDUES))
+        self.assertAlmostEqual(sklad[RESIDUES.index('A')], 0.5)
+        self.assertAlmostEqual(sklad[RESIDUES.index('X')], 0.25)
+        self.assertAlmostEqual(sum(sklad), 1.0)
+
+    def test_hydropatia(self):
+        """Test profilu hydropatii w oknach."""
+        profil = hydropathy(ProteinSequence("p", "AAIIR"), window=2)
+        self.assertEqual([round(x, 2) for x in profil], [1.8, 3.15, 4.5, 0.0])
+        self.assertEqual(len(hydropathy(self.insulina)), len(self.insulina) - 8)
+        with self.assertRaises(ValueError):
+            hydropathy(self.lizyna, window=11)
+
+    def test_profil_kolekcji(self):
+        """Test profilu fizykochemicznego kolekcji białek."""
+        profil = protein_profile([self.insulina, self.lizyna])
+        self.assertEqual(profil['identifier'], ["insB", "polyK"])
+        self.assertEqual(list(profil['length']), [30, 10])
+        self.assertAlmostEqual(profil['gravy'][1], -3.9)
+
+    def test_tylko_bialka(self):
+        """Test odrzucania sekwencji innych niż białka."""
+        with self.assertRaises(TypeError):
+            molecular_weight(DNASequence("d", "ACGT"))
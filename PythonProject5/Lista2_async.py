@@ -0,0 +1,254 @@
+import asyncio
+import time
+
+from PythonProject5.Lista2_zadanie2 import DNASequence, RNASequence, _FastaParser
+
+"""
+@author Emilia Romanowska
+
+Źródła:
+- Dokumentacja Python: https://docs.python.org/3/reference/index.html
+- Wsparcie koncepcyjne i techniczne: ChatGPT
+"""
+
+# Znacznik końca strumienia przekazywany między kolejkami
+_END = object()
+
+
+async def read_fasta_async(reader, sequence_class=DNASequence):
+    """
+    Asynchronicznie wczytuje sekwencje FASTA.
+
+    Args:
+        reader: asyncio.StreamReader lub inny asynchroniczny iterator linii (bytes lub str)
+        sequence_class: klasa tworzonych sekwencji
+
+    Yields:
+        BioSequence: kolejne sekwencje ze strumienia
+    """
+    parser = _FastaParser(sequence_class)
+    async for line in reader:
+        if isinstance(line, bytes):
+            line = line.decode('utf-8')
+        sequence = parser.feed(line)
+        if sequence is not None:
+            yield sequence
+
+    sequence = parser.finish()
+    if sequence is not None:
+        yield sequence
+
+
+async def write_fasta_async(writer, sequence):
+    """
+    Zapisuje sekwencję w formacie FASTA do strumienia asynchronicznego.
+
+    Args:
+        writer: asyncio.StreamWriter lub obiekt z write(bytes) i opcjonalnym drain()
+        sequence: sekwencja do zapisania
+    """
+    writer.write(f"{sequence}\n".encode('utf-8'))
+    drain = getattr(writer, 'drain', None)
+    if drain is not None:
+        await drain()
+
+
+class StageStats:
+    """Statystyki jednego etapu potoku: liczba elementów, opóźnienie i przepustowość."""
+
+    def __init__(self, name):
+        """
+        Konstruktor statystyk.
+
+        Args:
+            name: nazwa etapu
+        """
+        self.name = name
+        self.processed = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+        self._first = None
+        self._last = None
+
+    def record(self, started, finished):
+        """Rejestruje przetworzenie jednego elementu."""
+        latency = finished - started
+        self.processed += 1
+        self.total_latency += latency
+        self.max_latency = max(self.max_latency, latency)
+        if self._first is None:
+            self._first = started
+        self._last = finished
+
+    @property
+    def mean_latency(self):
+        """Średnie opóźnienie na element (w sekundach)."""
+        return self.total_latency / self.processed if self.processed else 0.0
+
+    @property
+    def throughput(self):
+        """Przepustowość w elementach na sekundę (od pierwszego do ostatniego elementu)."""
+        if not self.processed or self._last == self._first:
+            return 0.0
+        return self.processed / (self._last - self._first)
+
+    def as_dict(self):
+        """Zwraca statystyki jako słownik."""
+        return {
+            'processed': self.processed,
+            'mean_latency': self.mean_latency,
+            'max_latency': self.max_latency,
+            'throughput': self.throughput,
+        }
+
+
+class Stage:
+    """Etap potoku: funkcja sekwencja -> sekwencja, opcjonalnie uruchamiana w executorze."""
+
+    def __init__(self, name, func, offload=True, workers=1):
+        """
+        Konstruktor etapu.
+
+        Args:
+            name: nazwa etapu (klucz w statystykach)
+            func: funkcja przyjmująca i zwracająca sekwencję
+            offload: czy uruchamiać funkcję w executorze, by nie blokować pętli zdarzeń
+            workers: liczba równoległych zadań etapu (>1 nie zachowuje kolejności)
+        """
+        if not callable(func):
+            raise TypeError("Funkcja etapu musi być wywoływalna")
+        if not isinstance(workers, int) or workers < 1:
+            raise ValueError("Liczba zadań etapu musi być dodatnią liczbą całkowitą")
+
+        self.name = name
+        self.func = func
+        self.offload = offload
+        self.workers = workers
+
+
+class AsyncPipeline:
+    """
+    Asynchroniczny potok: czytnik FASTA -> etapy -> zapis FASTA.
+
+    Etapy połączone są ograniczonymi kolejkami asyncio.Queue, więc wolny
+    etap lub wolny odbiorca spowalnia czytanie (backpressure). Etapy
+    obliczeniowe uruchamiane są w executorze, dzięki czemu jedna pętla
+    zdarzeń może równolegle obsługiwać wiele strumieni - każde wywołanie
+    run() ma własne kolejki, a statystyki sumują się w obrębie potoku.
+    """
+
+    def __init__(self, stages, maxsize=64, executor=None):
+        """
+        Konstruktor potoku.
+
+        Args:
+            stages: lista obiektów Stage
+            maxsize: pojemność każdej kolejki między etapami
+            executor: executor dla etapów obliczeniowych (None - domyślny executor pętli)
+        """
+        if not stages:
+            raise ValueError("Potok musi mieć co najmniej jeden etap")
+        if not isinstance(maxsize, int) or maxsize < 1:
+            raise ValueError("Pojemność kolejki musi być dodatnią liczbą całkowitą")
+
+        self.stages = list(stages)
+        self.maxsize = maxsize
+        self.executor = executor
+        self._stats = {name: StageStats(name) for name in
+                       ['read'] + [stage.name for stage in self.stages] + ['write']}
+
+    def metrics(self):
+        """
+        Zwraca statystyki wszystkich etapów.
+
+        Returns:
+            dict: nazwa etapu -> słownik z processed, mean_latency, max_latency, throughput
+        """
+        return {name: stats.as_dict() for name, stats in self._stats.items()}
+
+    async def _read(self, source, output):
+        """Przepisuje elementy źródła do pierwszej kolejki."""
+        stats = self._stats['read']
+        started = time.perf_counter()
+        async for sequence in source:
+            finished = time.perf_counter()
+            stats.record(started, finished)
+            await output.put(sequence)
+            started = time.perf_counter()
+        await output.put(_END)
+
+    async def _work(self, stage, input_queue, output):
+        """Pojedyncze zadanie etapu: pobiera, przetwarza i przekazuje dalej."""
+        loop = asyncio.get_running_loop()
+        stats = self._stats[stage.name]
+        while True:
+            sequence = await input_queue.get()
+            if sequence is _END:
+                # Oddajemy znacznik pozostałym zadaniom tego etapu
+                await input_queue.put(_END)
+                return
+
+            started = time.perf_counter()
+            if stage.offload:
+                result = await loop.run_in_executor(self.executor, stage.func, sequence)
+            else:
+                result = stage.func(sequence)
+            stats.record(started, time.perf_counter())
+            await output.put(result)
+
+    async def _run_stage(self, stage, input_queue, output):
+        """Uruchamia wszystkie zadania etapu i po ich zakończeniu przekazuje znacznik końca."""
+        async with asyncio.TaskGroup() as group:
+            for _ in range(stage.workers):
+                group.create_task(self._work(stage, input_queue, output))
+        await output.put(_END)
+
+    async def _write(self, input_queue, writer):
+        """Zapisuje wyniki ostatniego etapu."""
+        stats = self._stats['write']
+        while True:
+            sequence = await input_queue.get()
+            if sequence is _END:
+                return
+            started = time.perf_counter()
+            await write_fasta_async(writer, sequence)
+            stats.record(started, time.perf_counter())
+
+    async def run(self, source, writer):
+        """
+        Przepuszcza strumień sekwencji przez potok.
+
+        Args:
+            source: asynchroniczny iterator sekwencji (np. read_fasta_async(...))
+            writer: asyncio.StreamWriter lub obiekt z write(bytes) i opcjonalnym drain()
+        """
+        queues = [asyncio.Queue(self.maxsize) for _ in range(len(self.stages) + 1)]
+        try:
+            async with asyncio.TaskGroup() as group:
+                group.create_task(self._read(source, queues[0]))
+                for stage, input_queue, output in zip(self.stages, queues, queues[1:]):
+                    group.create_task(self._run_stage(stage, input_queue, output))
+                group.create_task(self._write(queues[-1], writer))
+        except BaseExceptionGroup as errors:
+            # Zgłaszamy pierwotny błąd etapu zamiast zagnieżdżonej grupy wyjątków
+            while isinstance(errors, BaseExceptionGroup):
+                errors = errors.exceptions[0]
+            raise errors
+
+
+def transcribe_translate_pipeline(maxsize=64, executor=None, workers=1):
+    """
+    Tworzy potok DNA -> transkrypcja -> translacja -> białko.
+
+    Args:
+        maxsize: pojemność kolejek między etapami
+        executor: executor dla etapów (np. ProcessPoolExecutor dla pełnej równoległości)
+        workers: liczba równoległych zadań w każdym etapie
+
+    Returns:
+        AsyncPipeline: gotowy potok
+    """
+    return AsyncPipeline([
+        Stage('transcribe', DNASequence.transcribe, workers=workers),
+        Stage('translate', RNASequence.translate, workers=workers),
+    ], maxsize=maxsize, executor=executor)
@@ -0,0 +1,194 @@
+import os
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import islice
+from multiprocessing import shared_memory
+
+from PythonProject5.Lista2_zadanie2 import BioSequence, DNASequence, read_fasta
+
+"""
+@author Emilia Romanowska
+
+Źródła:
+- Dokumentacja Python: https://docs.python.org/3/reference/index.html
+- Wsparcie koncepcyjne i techniczne: ChatGPT
+"""
+
+# Etapy, które można uruchomić w procesach roboczych (nazwy metod sekwencji)
+STAGES = ('complement', 'transcribe', 'translate')
+
+
+def _pack(buffers, use_shared_memory):
+    """
+    Skleja bufory zasad w jeden blok i zwraca (offsety, ładunek).
+
+    Ładunkiem jest nazwa bloku pamięci współdzielonej albo bytes.
+    """
+    offsets = [0]
+    for buffer in buffers:
+        offsets.append(offsets[-1] + len(buffer))
+
+    if not use_shared_memory:
+        return offsets, b''.join(buffers)
+
+    # Blok musi mieć niezerowy rozmiar
+    block = shared_memory.SharedMemory(create=True, size=max(offsets[-1], 1))
+    for buffer, start, stop in zip(buffers, offsets, offsets[1:]):
+        block.buf[start:stop] = buffer
+    name = block.name
+    block.close()
+    return offsets, name
+
+
+def _unpack(classes, identifiers, offsets, payload, use_shared_memory):
+    """Odtwarza sekwencje z ładunku utworzonego przez _pack()."""
+    if not use_shared_memory:
+        return [cls._from_buffer(identifier, bytearray(payload[start:stop]))
+                for cls, identifier, start, stop in zip(classes, identifiers, offsets, offsets[1:])]
+
+    block = shared_memory.SharedMemory(name=payload)
+    try:
+        return [cls._from_buffer(identifier, bytearray(block.buf[start:stop]))
+                for cls, identifier, start, stop in zip(classes, identifiers, offsets, offsets[1:])]
+    finally:
+        block.close()
+
+
+def _release(payload, use_shared_memory):
+    """Zwalnia blok pamięci współdzielonej po odczytaniu wyników."""
+    if use_shared_memory:
+        block = shared_memory.SharedMemory(name=payload)
+        block.close()
+        block.unlink()
+
+
+def _process_chunk(classes, identifiers, offsets, payload, stages, use_shared_memory):
+    """
+    Funkcja procesu roboczego: odtwarza paczkę sekwencji i przepuszcza ją przez etapy.
+
+    Returns:
+        tuple: (klasy, identyfikatory, offsety, ładunek) z wynikami
+    """
+    results = _unpack(classes, identifiers, offsets, payload, use_shared_memory)
+    for stage in stages:
+        results = [getattr(sequence, stage)() for sequence in results]
+
+    offsets, payload = _pack([sequence._buffer for sequence in results], use_shared_memory)
+    return [type(sequence) for sequence in results], [sequence.identifier for sequence in results], offsets, payload
+
+
+def _submit(executor, chunk, stages, use_shared_memory):
+    """Pakuje paczkę sekwencji i wysyła ją do puli procesów."""
+    # Rekordy SequenceStore zamieniamy na zwykłe sekwencje
+    chunk = [sequence if isinstance(sequence, BioSequence) else sequence.to_sequence() for sequence in chunk]
+    offsets, payload = _pack([sequence._buffer for sequence in chunk], use_shared_memory)
+    try:
+        future = executor.submit(_process_chunk, [type(sequence) for sequence in chunk],
+                                 [sequence.identifier for sequence in chunk],
+                                 offsets, payload, stages, use_shared_memory)
+    except BaseException:
+        _release(payload, use_shared_memory)
+        raise
+    return future, payload
+
+
+def _collect(future, payload, use_shared_memory):
+    """Odbiera wynik paczki i zwalnia pamięć współdzieloną wejścia i wyjścia."""
+    try:
+        classes, identifiers, offsets, result_payload = future.result()
+    finally:
+        _release(payload, use_shared_memory)
+
+    try:
+        return _unpack(classes, identifiers, offsets, result_payload, use_shared_memory)
+    finally:
+        _release(result_payload, use_shared_memory)
+
+
+def _process_batch(sequences, stages, max_workers, chunk_size, ordered, use_shared_memory):
+    """Generator wykonujący process_batch() na sprawdzonych już parametrach."""
+    max_in_flight = 2 * max_workers
+    iterator = iter(sequences)
+    pending = deque()
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        try:
+            while True:
+                chunk = list(islice(iterator, chunk_size))
+                if chunk:
+                    pending.append(_submit(executor, chunk, stages, use_shared_memory))
+                if not pending:
+                    break
+                if chunk and len(pending) < max_in_flight:
+                    continue
+
+                # Odbieramy wyniki: najstarszą paczkę albo dowolną ukończoną
+                if ordered:
+                    yield from _collect(*pending.popleft(), use_shared_memory)
+                else:
+                    done, _ = wait([future for future, _ in pending], return_when=FIRST_COMPLETED)
+                    for item in [item for item in pending if item[0] in done]:
+                        pending.remove(item)
+                        yield from _collect(*item, use_shared_memory)
+        finally:
+            # Przerwanie (wyjątek lub porzucony generator) - sprzątamy pozostałe paczki
+            for future, payload in pending:
+                future.cancel()
+                try:
+                    _collect(future, payload, use_shared_memory)
+                except Exception:
+                    pass
+
+
+def process_batch(sequences, stages=('transcribe', 'translate'), max_workers=None,
+                  chunk_size=1000, ordered=True, use_shared_memory=True):
+    """
+    Przetwarza kolekcję sekwencji równolegle w puli procesów.
+
+    Sekwencje dzielone są na paczki po chunk_size; zasady każdej paczki
+    przekazywane są przez pamięć współdzieloną zamiast picklowania stringów.
+    Jednocześnie w obiegu jest najwyżej 2 * max_workers paczek, więc wejście
+    może być dowolnie długim strumieniem.
+
+    Args:
+        sequences: iterowalna kolekcja sekwencji (BioSequence lub rekordy SequenceStore)
+        stages: nazwy etapów wykonywanych po kolei (z STAGES)
+        max_workers: liczba procesów (domyślnie liczba rdzeni)
+        chunk_size: liczba sekwencji w jednej paczce
+        ordered: czy zachować kolejność wejścia (False - wyniki w kolejności ukończenia)
+        use_shared_memory: czy przesyłać zasady przez pamięć współdzieloną
+
+    Parametry sprawdzane są od razu przy wywołaniu, a nie przy pierwszym
+    pobraniu wyniku.
+
+    Returns:
+        generator: wyniki ostatniego etapu (BioSequence)
+    """
+    stages = tuple(stages)
+    for stage in stages:
+        if stage not in STAGES:
+            raise ValueError(f"Nieznany etap: {stage}. Dozwolone: {STAGES}")
+
+    if not isinstance(chunk_size, int) or chunk_size < 1:
+        raise ValueError("Rozmiar paczki musi być dodatnią liczbą całkowitą")
+
+    if max_workers is not None and (not isinstance(max_workers, int) or max_workers < 1):
+        raise ValueError("Liczba procesów musi być dodatnią liczbą całkowitą")
+
+    max_workers = max_workers or os.cpu_count() or 1
+    return _process_batch(sequences, stages, max_workers, chunk_size, ordered, use_shared_memory)
+
+
+def process_fasta(lines, sequence_class=DNASequence, **kwargs):
+    """
+    Przetwarza strumień FASTA równolegle (patrz process_batch).
+
+    Args:
+        lines: iterowalna kolekcja linii pliku FASTA
+        sequence_class: klasa sekwencji w pliku
+        **kwargs: parametry przekazywane do process_batch
+
+    Returns:
+        generator: wyniki ostatniego etapu (BioSequence)
+    """
+    return process_batch(read_fasta(lines, sequence_class), **kwargs)
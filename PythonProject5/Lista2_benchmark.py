@@ -0,0 +1,304 @@
+import argparse
+import json
+import random
+import sys
+import time
+import tracemalloc
+
+from PythonProject5.Lista2_zadanie2 import DNASequence, RNASequence, read_fasta
+
+"""
+@author Emilia Romanowska
+
+Źródła:
+- Dokumentacja Python: https://docs.python.org/3/reference/index.html
+- Wsparcie koncepcyjne i techniczne: ChatGPT
+"""
+
+# Benchmark przepustowości hierarchii BioSequence na syntetycznych danych.
+# Działa offline, korzysta wyłącznie z biblioteki standardowej.
+
+DEFAULT_SIZES = [1_000, 100_000, 1_000_000]
+
+# Kodony bez kodonów stop - translacja losowego RNA nie kończy się przedwcześnie
+_SENSE_CODONS = [codon.encode('ascii') for codon, amino_acid in RNASequence.GENETIC_CODE.items()
+                 if amino_acid != '*']
+
+# Tablice translacji: losowy bajt b -> kolejne zasady kodonu _SENSE_CODONS[b % 61]
+_CODON_BASE_TABLES = [bytes(_SENSE_CODONS[code % len(_SENSE_CODONS)][i] for code in range(256))
+                      for i in range(3)]
+
+_SIZE_SUFFIXES = {'k': 10 ** 3, 'm': 10 ** 6, 'g': 10 ** 9}
+
+
+def parse_size(text):
+    """
+    Zamienia rozmiar typu '1k', '10M', '1G' na liczbę zasad.
+
+    Args:
+        text: rozmiar z opcjonalnym przyrostkiem k/M/G (potęgi 10)
+
+    Returns:
+        int: liczba zasad
+    """
+    text = text.strip().lower().rstrip('b')
+    multiplier = _SIZE_SUFFIXES.get(text[-1:], 1)
+    if text[-1:] in _SIZE_SUFFIXES:
+        text = text[:-1]
+    return int(float(text) * multiplier)
+
+
+def generate_sequence(length, alphabet='ACGT', seed=0):
+    """
+    Generuje powtarzalną losową sekwencję bez pętli w Pythonie.
+
+    Args:
+        length: liczba zasad
+        alphabet: alfabet (długość musi dzielić 256)
+        seed: ziarno generatora
+
+    Returns:
+        bytes: wygenerowana sekwencja
+    """
+    if 256 % len(alphabet):
+        raise ValueError("Długość alfabetu musi dzielić 256")
+    table = (alphabet * (256 // len(alphabet))).encode('ascii')
+    return random.Random(seed).randbytes(length).translate(table)
+
+
+def generate_coding_rna(length, seed=0):
+    """
+    Generuje RNA złożone wyłącznie z kodonów sensownych (bez stop).
+
+    Każdy losowy bajt wybiera kodon; trzy tablice translacji dają jego
+    kolejne zasady, a przypisania do wycinków z krokiem 3 przeplatają je
+    w wyniku - bez pętli w Pythonie.
+
+    Args:
+        length: przybliżona liczba zasad (zaokrąglana w dół do wielokrotności 3)
+        seed: ziarno generatora
+
+    Returns:
+        bytes: wygenerowana sekwencja RNA
+    """
+    codes = random.Random(seed).randbytes(length // 3)
+    rna = bytearray(3 * len(codes))
+    for offset, table in enumerate(_CODON_BASE_TABLES):
+        rna[offset::3] = codes.translate(table)
+    return bytes(rna)
+
+
+def _time(func, repeat):
+    """Zwraca najlepszy czas z repeat uruchomień."""
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def _peak_memory(func):
+    """Zwraca szczytową pamięć zaalokowaną podczas jednego uruchomienia."""
+    tracing = tracemalloc.is_tracing()
+    if not tracing:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    before = tracemalloc.get_traced_memory()[0]
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1] - before
+    finally:
+        if not tracing:
+            tracemalloc.stop()
+
+
+def _operations(size, seed):
+    """
+    Zwraca listę (nazwa, przygotowanie, jednostka) dla operacji benchmarku.
+
+    Przygotowanie wywoływane jest dopiero dla wybranej operacji, zwraca parę
+    (funkcja, liczba jednostek) i nie jest wliczane do pomiarów. Dane każdej
+    operacji są osobne i zwalniane przed następną, więc w pamięci są naraz
+    tylko dane jednej operacji - także dla rozmiarów rzędu 1G.
+    """
+    def construct():
+        text = generate_sequence(size, 'ACGT', seed).decode('ascii')
+        return lambda: DNASequence("bench", text), size
+
+    def mutate():
+        dna = DNASequence("bench", generate_sequence(size, 'ACGT', seed))
+        mutations = 10_000
+        rng = random.Random(seed)
+        positions = [rng.randrange(size) for _ in range(mutations)]
+        bases = [rng.choice('ACGT') for _ in range(mutations)]
+
+        def run():
+            for position, base in zip(positions, bases):
+                dna.mutate(position, base)
+
+        return run, mutations
+
+    def find_motif():
+        dna = DNASequence("bench", generate_sequence(size, 'ACGT', seed))
+        # Tak długi motyw praktycznie nie występuje w losowych danych - pełne przeszukanie
+        motif = 'ACGT' * 8 + 'A'
+        return lambda: dna.findMotif(motif), size
+
+    def complement():
+        return DNASequence("bench", generate_sequence(size, 'ACGT', seed)).complement, size
+
+    def transcribe():
+        return DNASequence("bench", generate_sequence(size, 'ACGT', seed)).transcribe, size
+
+    def translate():
+        rna = RNASequence("bench", generate_coding_rna(size, seed))
+        return rna.translate, len(rna)
+
+    def fasta_roundtrip():
+        dna = DNASequence("bench", generate_sequence(size, 'ACGT', seed))
+        return lambda: next(read_fasta(str(dna).splitlines())), size
+
+    def fasta_read():
+        fasta_lines = [">bench", generate_sequence(size, 'ACGT', seed).decode('ascii')]
+        return lambda: next(read_fasta(fasta_lines)), size
+
+    return [
+        ('construct', construct, 'bases'),
+        ('mutate', mutate, 'ops'),
+        ('findMotif', find_motif, 'bases'),
+        ('complement', complement, 'bases'),
+        ('transcribe', transcribe, 'bases'),
+        ('translate', translate, 'bases'),
+        ('fasta_roundtrip', fasta_roundtrip, 'bases'),
+        ('fasta_read', fasta_read, 'bases'),
+    ]
+
+
+def run_benchmarks(sizes=None, operations=None, repeat=3, seed=0, measure_memory=True):
+    """
+    Uruchamia benchmark dla podanych rozmiarów danych.
+
+    Args:
+        sizes: lista rozmiarów w zasadach (domyślnie DEFAULT_SIZES)
+        operations: nazwy operacji do zmierzenia (domyślnie wszystkie)
+        repeat: liczba powtórzeń pomiaru czasu (brany najlepszy)
+        seed: ziarno generatora danych
+        measure_memory: czy mierzyć szczytową pamięć (dodatkowe uruchomienie)
+
+    Returns:
+        list: słowniki z polami operation, size, seconds, rate, unit, peak_bytes
+    """
+    results = []
+    for size in sizes or DEFAULT_SIZES:
+        for name, setup, unit in _operations(size, seed):
+            if operations and name not in operations:
+                continue
+            func, units = setup()
+            seconds = _time(func, repeat)
+            results.append({
+                'operation': name,
+                'size': size,
+                'seconds': seconds,
+                'rate': units / seconds if seconds else float('inf'),
+                'unit': f"{unit}/s",
+                'peak_bytes': _peak_memory(func) if measure_memory else None,
+            })
+            # Zwalniamy dane operacji przed przygotowaniem następnej
+            del func
+    return results
+
+
+def _key(result):
+    """Klucz wyniku w pliku bazowym."""
+    return f"{result['operation']}@{result['size']}"
+
+
+def save_baseline(results, path):
+    """
+    Zapisuje wyniki jako punkt odniesienia (JSON).
+
+    Args:
+        results: wyniki z run_benchmarks()
+        path: ścieżka pliku
+    """
+    baseline = {_key(result): {'rate': result['rate'], 'peak_bytes': result['peak_bytes']}
+                for result in results}
+    with open(path, 'w', encoding='utf-8') as file:
+        json.dump(baseline, file, indent=2, sort_keys=True)
+
+
+def load_baseline(path):
+    """Wczytuje punkt odniesienia zapisany przez save_baseline()."""
+    with open(path, encoding='utf-8') as file:
+        return json.load(file)
+
+
+def find_regressions(results, baseline, tolerance=0.2):
+    """
+    Porównuje wyniki z punktem odniesienia.
+
+    Args:
+        results: wyniki z run_benchmarks()
+        baseline: słownik z load_baseline()
+        tolerance: dopuszczalny względny spadek przepustowości / wzrost pamięci
+
+    Returns:
+        list: opisy regresji (pusta lista - brak regresji)
+    """
+    regressions = []
+    for result in results:
+        reference = baseline.get(_key(result))
+        if reference is None:
+            continue
+        if result['rate'] < reference['rate'] * (1 - tolerance):
+            regressions.append(f"{_key(result)}: przepustowość {result['rate']:.3g} {result['unit']}"
+                               f" < {reference['rate']:.3g} (odniesienie)")
+        if (result['peak_bytes'] is not None and reference.get('peak_bytes') is not None
+                and result['peak_bytes'] > reference['peak_bytes'] * (1 + tolerance)):
+            regressions.append(f"{_key(result)}: pamięć {result['peak_bytes']} B"
+                               f" > {reference['peak_bytes']} B (odniesienie)")
+    return regressions
+
+
+def format_results(results):
+    """Zwraca wyniki jako czytelną tabelę tekstową."""
+    lines = [f"{'operacja':<16} {'rozmiar':>12} {'czas [s]':>10} {'przepustowość':>22} {'pamięć [B]':>14}"]
+    for result in results:
+        peak = '-' if result['peak_bytes'] is None else str(result['peak_bytes'])
+        lines.append(f"{result['operation']:<16} {result['size']:>12} {result['seconds']:>10.4f} "
+                     f"{result['rate']:>14.3g} {result['unit']:<7} {peak:>14}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    """Punkt wejścia wiersza poleceń."""
+    parser = argparse.ArgumentParser(description="Benchmark przepustowości sekwencji biologicznych")
+    parser.add_argument('--sizes', nargs='+', default=None,
+                        help="rozmiary danych, np. 1k 1M 1G (domyślnie 1k 100k 1M)")
+    parser.add_argument('--operations', nargs='+', default=None, help="operacje do zmierzenia")
+    parser.add_argument('--repeat', type=int, default=3, help="liczba powtórzeń pomiaru czasu")
+    parser.add_argument('--no-memory', action='store_true', help="pomiń pomiar pamięci")
+    parser.add_argument('--save', metavar='PLIK', help="zapisz wyniki jako punkt odniesienia")
+    parser.add_argument('--compare', metavar='PLIK', help="porównaj z punktem odniesienia")
+    parser.add_argument('--tolerance', type=float, default=0.2, help="tolerancja regresji (0.2 = 20%%)")
+    args = parser.parse_args(argv)
+
+    sizes = [parse_size(size) for size in args.sizes] if args.sizes else None
+    results = run_benchmarks(sizes, args.operations, args.repeat, measure_memory=not args.no_memory)
+    print(format_results(results))
+
+    if args.save:
+        save_baseline(results, args.save)
+
+    if args.compare:
+        regressions = find_regressions(results, load_baseline(args.compare), args.tolerance)
+        for regression in regressions:
+            print("REGRESJA:", regression)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
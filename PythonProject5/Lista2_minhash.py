@@ -0,0 +1,255 @@
+import random
+from array import array
+
+from PythonProject5.Lista2_zadanie2 import BioSequence, NucleicAcidSequence
+
+"""
+@author Emilia Romanowska
+
+Źródła:
+- Dokumentacja Python: https://docs.python.org/3/reference/index.html
+- Wsparcie koncepcyjne i techniczne: ChatGPT
+"""
+
+# Liczba pierwsza Mersenne'a 2^61 - 1 dla haszu (a * x + b) mod P
+_PRIME = (1 << 61) - 1
+
+# Przesunięcie wartości pożyczonej z sąsiedniego kubełka (na każdy krok odległości)
+_DENSIFY_STEP = 0x9E3779B97F4A7C15
+
+
+def deduplicate(sequences):
+    """
+    Usuwa sekwencje o identycznej zawartości (pierwsze wystąpienie zostaje).
+
+    Porównywane są zapamiętane skróty content_digest(), więc koszt to O(1)
+    na sekwencję zamiast porównywania pełnych danych.
+
+    Args:
+        sequences: iterowalna kolekcja sekwencji
+
+    Yields:
+        BioSequence: sekwencje o niepowtarzającej się zawartości
+    """
+    seen = set()
+    for sequence in sequences:
+        digest = sequence.content_digest()
+        if digest not in seen:
+            seen.add(digest)
+            yield sequence
+
+
+def _shingles(sequence, k):
+    """
+    Zwraca zbiór kodów k-merów sekwencji.
+
+    Dla DNA/RNA używane są kanoniczne k-mery z kroczącego haszu 2-bitowego,
+    dla pozostałych sekwencji - bajty k-meru zamienione na liczbę.
+    """
+    if isinstance(sequence, NucleicAcidSequence):
+        return set(sequence.kmer_iter(k, canonical=True))
+    buffer = sequence._buffer
+    return {int.from_bytes(buffer[i:i + k], 'big') for i in range(len(buffer) - k + 1)}
+
+
+class MinHash:
+    """
+    Szkic MinHash zbioru k-merów sekwencji (one permutation hashing).
+
+    Każdy k-mer haszowany jest raz; zakres haszu dzielony jest na num_perm
+    kubełków, a pozycja szkicu to minimum haszy w kubełku. Puste kubełki
+    wypełniane są wartością najbliższego niepustego kubełka na prawo
+    (densyfikacja przez rotację), więc szkice mają wyrównane pozycje.
+    Ułamek zgodnych pozycji dwóch szkiców przybliża współczynnik Jaccarda
+    zbiorów k-merów, więc podobieństwo liczone jest bez porównywania sekwencji.
+    """
+
+    __slots__ = ('k', 'seed', 'signature')
+
+    def __init__(self, signature, k, seed=0):
+        """
+        Konstruktor szkicu (zwykle używaj from_sequence()).
+
+        Args:
+            signature: array('Q') z minimalnymi wartościami haszy
+            k: długość k-meru użyta do budowy szkicu
+            seed: ziarno funkcji haszującej
+        """
+        self.signature = signature
+        self.k = k
+        self.seed = seed
+
+    @staticmethod
+    def _hash_parameters(seed):
+        """Zwraca współczynniki (a, b) haszu - te same dla tego samego ziarna."""
+        rng = random.Random(seed)
+        return rng.randrange(1, _PRIME), rng.randrange(_PRIME)
+
+    @classmethod
+    def from_sequence(cls, sequence, k=16, num_perm=128, seed=0):
+        """
+        Buduje szkic MinHash dla sekwencji.
+
+        Args:
+            sequence: sekwencja (BioSequence)
+            k: długość k-meru
+            num_perm: liczba kubełków (długość szkicu)
+            seed: ziarno funkcji haszującej
+
+        Returns:
+            MinHash: szkic sekwencji
+        """
+        if not isinstance(sequence, BioSequence):
+            raise TypeError("Szkic można zbudować tylko dla BioSequence")
+        if not isinstance(k, int) or k < 1:
+            raise ValueError("Długość k-meru musi być dodatnią liczbą całkowitą")
+        if not isinstance(num_perm, int) or num_perm < 1:
+            raise ValueError("Liczba kubełków musi być dodatnią liczbą całkowitą")
+        if len(sequence) < k:
+            raise ValueError(f"Sekwencja krótsza niż k ({k})")
+
+        a, b = cls._hash_parameters(seed)
+        bins = [None] * num_perm
+        for code in _shingles(sequence, k):
+            value = (a * code + b) % _PRIME
+            # Kubełek wyznaczają najstarsze bity haszu (wartość < 2^61)
+            index = (value * num_perm) >> 61
+            current = bins[index]
+            if current is None or value < current:
+                bins[index] = value
+
+        # Densyfikacja: pusty kubełek dostaje wartość najbliższego niepustego na prawo
+        # (cyklicznie), przesuniętą zależnie od odległości
+        signature = array('Q', (0 if value is None else value for value in bins))
+        source = None
+        for i in range(2 * num_perm - 1, -1, -1):
+            value = bins[i % num_perm]
+            if value is not None:
+                source = (i, value)
+            elif i < num_perm:
+                signature[i] = (source[1] + (source[0] - i) * _DENSIFY_STEP) % _PRIME
+        return cls(signature, k, seed)
+
+    def __len__(self):
+        """Zwraca długość szkicu."""
+        return len(self.signature)
+
+    def jaccard(self, other):
+        """
+        Szacuje współczynnik Jaccarda zbiorów k-merów dwóch sekwencji.
+
+        Args:
+            other: drugi szkic (te same k, seed i długość)
+
+        Returns:
+            float: oszacowanie podobieństwa w zakresie 0.0-1.0
+        """
+        if (self.k, self.seed, len(self)) != (other.k, other.seed, len(other)):
+            raise ValueError("Szkice muszą mieć te same k, seed i liczbę kubełków")
+        matches = sum(a == b for a, b in zip(self.signature, other.signature))
+        return matches / len(self)
+
+
+class LSHIndex:
+    """
+    Indeks LSH (locality-sensitive hashing) dla szkiców MinHash.
+
+    Szkic dzielony jest na pasma; sekwencje, których szkice mają identyczne
+    choć jedno pasmo, trafiają do wspólnego kubełka i są kandydatami do
+    porównania - zamiast porównywać każdą sekwencję z każdą.
+    """
+
+    def __init__(self, num_perm=128, bands=32):
+        """
+        Konstruktor indeksu.
+
+        Args:
+            num_perm: długość indeksowanych szkiców
+            bands: liczba pasm (musi dzielić num_perm); więcej pasm - niższy próg podobieństwa
+        """
+        if bands < 1 or num_perm % bands:
+            raise ValueError("Liczba pasm musi dzielić długość szkicu")
+
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self._buckets = [{} for _ in range(bands)]
+        self._sketches = {}
+
+    def _band_keys(self, minhash):
+        """Zwraca klucze kolejnych pasm szkicu."""
+        if len(minhash) != self.num_perm:
+            raise ValueError(f"Indeks przyjmuje szkice o długości {self.num_perm}")
+        signature = minhash.signature
+        rows = self.rows
+        return [signature[band * rows:(band + 1) * rows].tobytes() for band in range(self.bands)]
+
+    def __len__(self):
+        """Zwraca liczbę szkiców w indeksie."""
+        return len(self._sketches)
+
+    def __contains__(self, key):
+        """Sprawdza, czy klucz jest w indeksie."""
+        return key in self._sketches
+
+    def insert(self, key, minhash):
+        """
+        Dodaje szkic do indeksu.
+
+        Args:
+            key: klucz (np. identyfikator sekwencji)
+            minhash: szkic MinHash
+        """
+        if key in self._sketches:
+            raise KeyError(f"Klucz {key!r} jest już w indeksie")
+        for buckets, band_key in zip(self._buckets, self._band_keys(minhash)):
+            buckets.setdefault(band_key, []).append(key)
+        self._sketches[key] = minhash
+
+    def query(self, minhash):
+        """
+        Zwraca kandydatów dzielących z szkicem co najmniej jedno pasmo.
+
+        Returns:
+            set: klucze kandydatów
+        """
+        candidates = set()
+        for buckets, band_key in zip(self._buckets, self._band_keys(minhash)):
+            candidates.update(buckets.get(band_key, ()))
+        return candidates
+
+    def query_similar(self, minhash, threshold=0.8):
+        """
+        Zwraca kandydatów o szacowanym podobieństwie co najmniej threshold.
+
+        Returns:
+            list: pary (klucz, podobieństwo) posortowane malejąco po podobieństwie
+        """
+        hits = [(key, minhash.jaccard(self._sketches[key])) for key in self.query(minhash)]
+        return sorted((hit for hit in hits if hit[1] >= threshold), key=lambda hit: -hit[1])
+
+
+def find_similar_pairs(sequences, threshold=0.8, k=16, num_perm=128, bands=32, seed=0):
+    """
+    Znajduje pary podobnych sekwencji w jednym przebiegu przez kolekcję.
+
+    Każda sekwencja jest najpierw odpytywana w indeksie LSH, a potem do niego
+    dodawana, więc porównywane są tylko pary z tym samym pasmem.
+
+    Args:
+        sequences: iterowalna kolekcja sekwencji (identyfikatory muszą być unikalne)
+        threshold: minimalne szacowane podobieństwo Jaccarda
+        k: długość k-meru
+        num_perm: długość szkiców
+        bands: liczba pasm LSH
+        seed: ziarno funkcji haszującej
+
+    Yields:
+        tuple: (identyfikator wcześniejszej, identyfikator bieżącej, podobieństwo)
+    """
+    index = LSHIndex(num_perm, bands)
+    for sequence in sequences:
+        minhash = MinHash.from_sequence(sequence, k, num_perm, seed)
+        for key, similarity in index.query_similar(minhash, threshold):
+            yield key, sequence.identifier, similarity
+        index.insert(sequence.identifier, minhash)
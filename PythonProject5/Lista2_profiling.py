@@ -0,0 +1,207 @@
+import functools
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+from PythonProject5.Lista2_zadanie1 import Wielomian
+from PythonProject5.Lista2_zadanie2 import BioSequence, DNASequence, NucleicAcidSequence, RNASequence
+
+"""
+@author Emilia Romanowska
+
+Źródła:
+- Dokumentacja Python: https://docs.python.org/3/reference/index.html
+- Wsparcie koncepcyjne i techniczne: ChatGPT
+"""
+
+# Instrumentacja jest opcjonalna: enable() podmienia metody klas na wersje
+# z licznikami, a disable() przywraca oryginały. Gdy profilowanie jest
+# wyłączone, w klasach nie ma żadnego dodatkowego kodu - koszt jest zerowy.
+
+
+def _argument_size(index):
+    """Zwraca funkcję mierzącą rozmiar argumentu o danym indeksie."""
+    def size(args):
+        try:
+            return len(args[index])
+        except (IndexError, TypeError):
+            return 0
+    return size
+
+
+def _sequence_size(args):
+    """Rozmiar wejścia metody sekwencji - długość sekwencji."""
+    return len(args[0])
+
+
+def _polynomial_size(args):
+    """Rozmiar wejścia metody wielomianu - liczba współczynników."""
+    return len(args[0]._wspolczynniki)
+
+
+# (klasa, nazwa metody, funkcja rozmiaru wejścia)
+_TARGETS = [
+    (BioSequence, '__init__', _argument_size(2)),
+    (BioSequence, 'mutate', _sequence_size),
+    (BioSequence, 'apply_mutations', _sequence_size),
+    (BioSequence, 'snapshot', _sequence_size),
+    (BioSequence, 'findMotif', _sequence_size),
+    (NucleicAcidSequence, 'kmer_counts', _sequence_size),
+    (DNASequence, 'complement', _sequence_size),
+    (DNASequence, 'transcribe', _sequence_size),
+    (RNASequence, 'translate', _sequence_size),
+    (Wielomian, '__init__', _argument_size(1)),
+    (Wielomian, '__call__', _polynomial_size),
+    (Wielomian, '__add__', _polynomial_size),
+    (Wielomian, '__sub__', _polynomial_size),
+    (Wielomian, '__mul__', _polynomial_size),
+    (Wielomian, '__iadd__', _polynomial_size),
+    (Wielomian, '__isub__', _polynomial_size),
+    (Wielomian, '__imul__', _polynomial_size),
+]
+
+# Nazwa metody -> [wywołania, czas, bajty, rozmiar wejścia]
+_counters = {}
+_originals = {}
+_track_memory = False
+# Czy to enable() uruchomiło tracemalloc (wtedy disable() je zatrzymuje)
+_started_tracemalloc = False
+
+
+def _counter(label):
+    """Zwraca (i w razie potrzeby tworzy) liczniki dla metody."""
+    if label not in _counters:
+        _counters[label] = [0, 0.0, 0, 0]
+    return _counters[label]
+
+
+def _instrument(cls, name, size):
+    """Tworzy wersję metody z licznikami."""
+    original = cls.__dict__[name]
+    counter = _counter(f"{cls.__name__}.{name}")
+
+    @functools.wraps(original)
+    def wrapper(*args, **kwargs):
+        counter[3] += size(args)
+        if _track_memory:
+            before = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+        started = time.perf_counter()
+        try:
+            return original(*args, **kwargs)
+        finally:
+            counter[1] += time.perf_counter() - started
+            counter[0] += 1
+            if _track_memory:
+                counter[2] += max(0, tracemalloc.get_traced_memory()[1] - before)
+
+    return original, wrapper
+
+
+def enable(track_memory=False):
+    """
+    Włącza profilowanie metod BioSequence i Wielomian.
+
+    Args:
+        track_memory: czy mierzyć zaalokowaną pamięć (przez tracemalloc -
+            zauważalnie wolniej; przy wywołaniach zagnieżdżonych wartość przybliżona)
+    """
+    global _track_memory, _started_tracemalloc
+    if _originals:
+        disable()
+
+    _track_memory = track_memory
+    if track_memory and not tracemalloc.is_tracing():
+        tracemalloc.start()
+        _started_tracemalloc = True
+
+    for cls, name, size in _TARGETS:
+        original, wrapper = _instrument(cls, name, size)
+        _originals[(cls, name)] = original
+        setattr(cls, name, wrapper)
+
+
+def disable():
+    """Wyłącza profilowanie i przywraca oryginalne metody (liczniki zostają)."""
+    global _track_memory, _started_tracemalloc
+    for (cls, name), original in _originals.items():
+        setattr(cls, name, original)
+    _originals.clear()
+
+    if _started_tracemalloc:
+        tracemalloc.stop()
+        _started_tracemalloc = False
+    _track_memory = False
+
+
+def is_enabled():
+    """Zwraca True, gdy profilowanie jest włączone."""
+    return bool(_originals)
+
+
+def reset():
+    """Zeruje wszystkie liczniki."""
+    for counter in _counters.values():
+        counter[:] = [0, 0.0, 0, 0]
+
+
+@contextmanager
+def profiled(track_memory=False):
+    """
+    Menedżer kontekstu włączający profilowanie na czas bloku.
+
+    Args:
+        track_memory: czy mierzyć zaalokowaną pamięć
+    """
+    enable(track_memory)
+    try:
+        yield
+    finally:
+        disable()
+
+
+def snapshot():
+    """
+    Zwraca bieżące liczniki jako słownik.
+
+    Returns:
+        dict: 'Klasa.metoda' -> {'calls', 'total_seconds', 'bytes_allocated', 'input_size'}
+              (tylko metody wywołane co najmniej raz)
+    """
+    return {
+        label: {
+            'calls': calls,
+            'total_seconds': seconds,
+            'bytes_allocated': allocated,
+            'input_size': input_size,
+        }
+        for label, (calls, seconds, allocated, input_size) in sorted(_counters.items())
+        if calls
+    }
+
+
+def to_prometheus(prefix='lista2'):
+    """
+    Eksportuje liczniki w formacie tekstowym Prometheus.
+
+    Args:
+        prefix: przedrostek nazw metryk
+
+    Returns:
+        str: metryki w formacie ekspozycji Prometheus
+    """
+    metrics = [
+        ('calls_total', 'calls', 'Liczba wywołań metody'),
+        ('seconds_total', 'total_seconds', 'Łączny czas wykonania metody w sekundach'),
+        ('allocated_bytes_total', 'bytes_allocated', 'Pamięć zaalokowana przez metodę w bajtach'),
+        ('input_size_total', 'input_size', 'Suma rozmiarów wejścia metody'),
+    ]
+    data = snapshot()
+    lines = []
+    for suffix, key, description in metrics:
+        name = f"{prefix}_{suffix}"
+        lines.append(f"# HELP {name} {description}")
+        lines.append(f"# TYPE {name} counter")
+        for label, values in data.items():
+            lines.append(f'{name}{{method="{label}"}} {values[key]}')
+    return "\n".join(lines) + "\n"
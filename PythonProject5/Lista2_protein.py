@@ -0,0 +1,213 @@
+from array import array
+from itertools import accumulate
+
+from PythonProject5.Lista2_zadanie2 import BioSequence, ProteinSequence, SequenceView
+
+"""
+@author Emilia Romanowska
+
+Źródła:
+- Dokumentacja Python: https://docs.python.org/3/reference/index.html
+- Wsparcie koncepcyjne i techniczne: ChatGPT
+- Masy reszt: ExPASy (średnie masy), pKa: EMBOSS, hydropatia: Kyte i Doolittle (1982)
+"""
+
+# Kolejność reszt w wynikach composition()
+RESIDUES = 'ACDEFGHIKLMNPQRSTVWYX'
+
+# Średnie masy reszt aminokwasowych (Da); X - przybliżona średnia reszta
+RESIDUE_MASSES = {
+    'A': 71.0788, 'R': 156.1875, 'N': 114.1038, 'D': 115.0886, 'C': 103.1388,
+    'E': 129.1155, 'Q': 128.1307, 'G': 57.0519, 'H': 137.1411, 'I': 113.1594,
+    'L': 113.1594, 'K': 128.1741, 'M': 131.1926, 'F': 147.1766, 'P': 97.1167,
+    'S': 87.0782, 'T': 101.1051, 'W': 186.2132, 'Y': 163.1760, 'V': 99.1326,
+    'X': 110.0,
+}
+
+# Masa cząsteczki wody dodawana raz na łańcuch (końce N i C)
+WATER_MASS = 18.01524
+
+# Stałe pKa grup jonizujących (EMBOSS)
+PKA_N_TERMINUS = 8.6
+PKA_C_TERMINUS = 3.6
+PKA_POSITIVE = {'K': 10.8, 'R': 12.5, 'H': 6.5}
+PKA_NEGATIVE = {'D': 3.9, 'E': 4.1, 'C': 8.5, 'Y': 10.1}
+
+# Skala hydropatii Kyte-Doolittle
+KYTE_DOOLITTLE = {
+    'A': 1.8, 'R': -4.5, 'N': -3.5, 'D': -3.5, 'C': 2.5, 'Q': -3.5, 'E': -3.5,
+    'G': -0.4, 'H': -3.2, 'I': 4.5, 'L': 3.8, 'K': -3.9, 'M': 1.9, 'F': 2.8,
+    'P': -1.6, 'S': -0.8, 'T': -0.7, 'W': -0.9, 'Y': -1.3, 'V': 4.2,
+}
+
+
+def _lookup_table(values):
+    """Buduje 256-elementową tablicę wartości indeksowaną kodem bajtowym reszty."""
+    table = [0.0] * 256
+    for residue, value in values.items():
+        table[ord(residue)] = value
+    return table
+
+
+_HYDROPATHY_TABLE = _lookup_table(KYTE_DOOLITTLE)
+
+
+def _residues(protein):
+    """Zwraca reszty białka jako obiekt bajtowy (bez kopii dla ProteinSequence)."""
+    if isinstance(protein, BioSequence):
+        if not isinstance(protein, ProteinSequence):
+            raise TypeError("Profil fizykochemiczny dostępny jest tylko dla ProteinSequence")
+        return protein._buffer
+    if isinstance(protein, SequenceView):
+        if not issubclass(protein.sequence_class, ProteinSequence):
+            raise TypeError("Profil fizykochemiczny dostępny jest tylko dla ProteinSequence")
+        return protein.tobytes()
+    return _residues(protein.view())
+
+
+def _is_single(proteins):
+    """Sprawdza, czy argument to pojedyncze białko, a nie kolekcja."""
+    return isinstance(proteins, (BioSequence, SequenceView)) or hasattr(proteins, 'to_sequence')
+
+
+def _counts(residues):
+    """Zlicza reszty - jedno przejście bytes.count() w C na każdą resztę."""
+    return {residue: residues.count(ord(residue)) for residue in RESIDUE_MASSES}
+
+
+def _molecular_weight(residues):
+    """Masa cząsteczkowa pojedynczego białka."""
+    counts = _counts(residues)
+    return sum(RESIDUE_MASSES[residue] * count for residue, count in counts.items()) + WATER_MASS
+
+
+def _net_charge(counts, ph):
+    """Ładunek netto białka przy danym pH (równanie Hendersona-Hasselbalcha)."""
+    positive = 1 / (1 + 10 ** (ph - PKA_N_TERMINUS))
+    positive += sum(counts[residue] / (1 + 10 ** (ph - pka)) for residue, pka in PKA_POSITIVE.items())
+    negative = 1 / (1 + 10 ** (PKA_C_TERMINUS - ph))
+    negative += sum(counts[residue] / (1 + 10 ** (pka - ph)) for residue, pka in PKA_NEGATIVE.items())
+    return positive - negative
+
+
+def _isoelectric_point(residues, precision=0.001):
+    """Punkt izoelektryczny pojedynczego białka (bisekcja ładunku netto)."""
+    counts = _counts(residues)
+    low, high = 0.0, 14.0
+    while high - low > precision:
+        middle = (low + high) / 2
+        if _net_charge(counts, middle) > 0:
+            low = middle
+        else:
+            high = middle
+    return (low + high) / 2
+
+
+def _composition(residues):
+    """Udział każdej reszty z RESIDUES w białku."""
+    total = len(residues)
+    return array('d', (residues.count(ord(residue)) / total if total else 0.0 for residue in RESIDUES))
+
+
+def _hydropathy(residues, window):
+    """Średnia hydropatia Kyte-Doolittle w oknach przesuwnych (sumy skumulowane)."""
+    if not isinstance(window, int) or window < 1:
+        raise ValueError("Rozmiar okna musi być dodatnią liczbą całkowitą")
+    if window > len(residues):
+        raise ValueError(f"Okno ({window}) dłuższe niż białko ({len(residues)})")
+
+    cumulative = array('d', accumulate(map(_HYDROPATHY_TABLE.__getitem__, residues), initial=0.0))
+    return array('d', ((cumulative[start + window] - cumulative[start]) / window
+                       for start in range(len(residues) - window + 1)))
+
+
+def molecular_weight(proteins):
+    """
+    Oblicza masę cząsteczkową (Da) białka lub kolekcji białek.
+
+    Args:
+        proteins: ProteinSequence (lub widok/rekord) albo iterowalna kolekcja białek
+
+    Returns:
+        float dla jednego białka, array('d') dla kolekcji
+    """
+    if _is_single(proteins):
+        return _molecular_weight(_residues(proteins))
+    return array('d', (_molecular_weight(_residues(protein)) for protein in proteins))
+
+
+def isoelectric_point(proteins):
+    """
+    Oblicza punkt izoelektryczny (pI) białka lub kolekcji białek.
+
+    Args:
+        proteins: ProteinSequence (lub widok/rekord) albo iterowalna kolekcja białek
+
+    Returns:
+        float dla jednego białka, array('d') dla kolekcji
+    """
+    if _is_single(proteins):
+        return _isoelectric_point(_residues(proteins))
+    return array('d', (_isoelectric_point(_residues(protein)) for protein in proteins))
+
+
+def composition(proteins):
+    """
+    Oblicza skład aminokwasowy (udziały reszt w kolejności RESIDUES).
+
+    Args:
+        proteins: ProteinSequence (lub widok/rekord) albo iterowalna kolekcja białek
+
+    Returns:
+        array('d') dla jednego białka, lista array('d') dla kolekcji
+    """
+    if _is_single(proteins):
+        return _composition(_residues(proteins))
+    return [_composition(_residues(protein)) for protein in proteins]
+
+
+def hydropathy(proteins, window=9):
+    """
+    Oblicza profil hydropatii Kyte-Doolittle w oknach przesuwnych (krok 1).
+
+    Koszt jest O(n) niezależnie od rozmiaru okna.
+
+    Args:
+        proteins: ProteinSequence (lub widok/rekord) albo iterowalna kolekcja białek
+        window: rozmiar okna
+
+    Returns:
+        array('d') dla jednego białka, lista array('d') dla kolekcji
+    """
+    if _is_single(proteins):
+        return _hydropathy(_residues(proteins), window)
+    return [_hydropathy(_residues(protein), window) for protein in proteins]
+
+
+def protein_profile(proteins):
+    """
+    Oblicza skalarne cechy fizykochemiczne dla kolekcji białek w jednym przebiegu.
+
+    Args:
+        proteins: iterowalna kolekcja białek
+
+    Returns:
+        dict: 'identifier' (lista), 'length', 'molecular_weight', 'isoelectric_point',
+              'gravy' (średnia hydropatia) - kolumny jako array
+    """
+    profile = {
+        'identifier': [],
+        'length': array('Q'),
+        'molecular_weight': array('d'),
+        'isoelectric_point': array('d'),
+        'gravy': array('d'),
+    }
+    for protein in proteins:
+        residues = _residues(protein)
+        profile['identifier'].append(protein.identifier)
+        profile['length'].append(len(residues))
+        profile['molecular_weight'].append(_molecular_weight(residues))
+        profile['isoelectric_point'].append(_isoelectric_point(residues))
+        total = len(residues)
+        profile['gravy'].append(sum(map(_HYDROPATHY_TABLE.__getitem__, residues)) / total if total else 0.0)
+    return profile
@@ -0,0 +1,219 @@
+import math
+from array import array
+from itertools import accumulate
+from operator import sub
+
+from PythonProject5.Lista2_zadanie2 import BioSequence, SequenceView
+
+"""
+@author Emilia Romanowska
+
+Źródła:
+- Dokumentacja Python: https://docs.python.org/3/reference/index.html
+- Wsparcie koncepcyjne i techniczne: ChatGPT
+"""
+
+# Statystyki składu w oknach przesuwnych.
+# Wartość dla okna [s, s + w) to różnica sum skumulowanych P[s + w] - P[s].
+# Okna przetwarzane są blokami, a dla każdej grupy symboli dwa kursory - przy
+# początkach okien (s) i przy ich końcach (s + w) - przesuwają się tylko do
+# przodu, sumując wyłącznie zasady nowe dla bloku. Każda zasada sumowana jest
+# więc najwyżej dwa razy na grupę: koszt jest O(n) niezależnie od w, a pamięć
+# pomocnicza to O(_BLOCK) zamiast tablic długości całej sekwencji.
+
+# Przybliżona długość fragmentu sekwencji sumowanego w jednym bloku
+_BLOCK = 1 << 16
+
+
+def _bases(sequence):
+    """Zwraca zasady sekwencji jako obiekt bajtowy (bez kopii dla BioSequence)."""
+    if isinstance(sequence, BioSequence):
+        return sequence._buffer
+    if isinstance(sequence, SequenceView):
+        return sequence.tobytes()
+    if hasattr(sequence, 'view'):
+        return sequence.view().tobytes()
+    if isinstance(sequence, str):
+        return sequence.upper().encode('ascii')
+    if isinstance(sequence, (bytes, bytearray, memoryview)):
+        return bytes(sequence).upper()
+    raise TypeError("Nieobsługiwany typ sekwencji")
+
+
+def _alphabet(sequence, bases):
+    """Zwraca alfabet sekwencji (VALID_CHARS klasy albo znaki obecne w danych)."""
+    if isinstance(sequence, BioSequence):
+        return sorted(sequence.VALID_CHARS)
+    if isinstance(sequence, SequenceView):
+        return sorted(sequence.sequence_class.VALID_CHARS)
+    return sorted(chr(code) for code in set(bases))
+
+
+def _indicator_table(symbols):
+    """Zwraca tablicę translacji: bajt symbolu -> 1, pozostałe bajty -> 0."""
+    table = bytearray(256)
+    for symbol in symbols:
+        table[ord(symbol)] = 1
+    return bytes(table)
+
+
+def window_starts(length, window, step=1):
+    """
+    Zwraca pozycje początków okien przesuwnych.
+
+    Args:
+        length: długość sekwencji
+        window: rozmiar okna
+        step: przesunięcie między kolejnymi oknami
+
+    Returns:
+        range: początki kolejnych pełnych okien
+    """
+    if not isinstance(window, int) or window < 1:
+        raise ValueError("Rozmiar okna musi być dodatnią liczbą całkowitą")
+    if not isinstance(step, int) or step < 1:
+        raise ValueError("Krok musi być dodatnią liczbą całkowitą")
+    if window > length:
+        raise ValueError(f"Okno ({window}) dłuższe niż sekwencja ({length})")
+    return range(0, length - window + 1, step)
+
+
+class _PrefixCursor:
+    """
+    Kursor sum skumulowanych symboli z jednej grupy, przesuwany tylko do przodu.
+
+    Pamięta liczbę symboli przed bieżącą pozycją, więc kolejne zapytanie
+    sumuje tylko zasady, których kursor jeszcze nie minął.
+    """
+
+    __slots__ = ('_bases', '_codes', '_table', '_typecode', '_position', '_total')
+
+    def __init__(self, bases, symbols):
+        """
+        Konstruktor kursora.
+
+        Args:
+            bases: zasady całej sekwencji
+            symbols: zliczane symbole (np. 'GC')
+        """
+        self._bases = bases
+        self._codes = [ord(symbol) for symbol in symbols]
+        self._table = _indicator_table(symbols)
+        self._typecode = 'I' if len(bases) < 2 ** 32 else 'Q'
+        self._position = 0
+        self._total = 0
+
+    def prefix_counts(self, positions):
+        """
+        Zwraca liczbę symboli w bases[:p] dla kolejnych pozycji p.
+
+        Args:
+            positions: niepusty, rosnący range pozycji, nie mniejszych niż
+                pozycje z poprzedniego wywołania
+
+        Returns:
+            array: liczba symboli przed każdą pozycją
+        """
+        bases = self._bases
+        first, last = positions[0], positions[-1]
+        # Fragment przed pierwszą pozycją tylko zliczamy - bez tablicy sum
+        self._total += sum(bases.count(code, self._position, first) for code in self._codes)
+        cumulative = array(self._typecode, accumulate(bases[first:last].translate(self._table),
+                                                      initial=self._total))
+        self._position, self._total = last, cumulative[-1]
+        return array(self._typecode, (cumulative[position - first] for position in positions))
+
+
+def _window_stats(bases, groups, window, step, combine):
+    """
+    Wylicza statystykę okien blokami, zapisując wyniki od razu do tablicy wynikowej.
+
+    Args:
+        bases: zasady sekwencji
+        groups: grupy symboli zliczanych osobno (np. ['G', 'C'])
+        window: rozmiar okna
+        step: przesunięcie między kolejnymi oknami
+        combine: funkcja liczb symboli poszczególnych grup w oknie -> wartość
+
+    Returns:
+        array('d'): wartość statystyki w każdym oknie
+    """
+    starts = window_starts(len(bases), window, step)
+    # Para kursorów na grupę: końce okien (s + w) i ich początki (s)
+    cursors = [(_PrefixCursor(bases, symbols), _PrefixCursor(bases, symbols)) for symbols in groups]
+    block = max(1, _BLOCK // step)
+    result = array('d')
+    for first in range(0, len(starts), block):
+        trailing = starts[first:first + block]
+        leading = range(trailing[0] + window, trailing[-1] + window + 1, step)
+        result.extend(map(combine, *(map(sub, ends.prefix_counts(leading), begins.prefix_counts(trailing))
+                                     for ends, begins in cursors)))
+    return result
+
+
+def _skew(bases, first, second, window, step):
+    """Wspólna implementacja skośności (first - second) / (first + second)."""
+    return _window_stats(bases, [first, second], window, step,
+                         lambda a, b: (a - b) / (a + b) if a + b else 0.0)
+
+
+def gc_content(sequence, window, step=1):
+    """
+    Oblicza zawartość GC w oknach przesuwnych.
+
+    Args:
+        sequence: sekwencja DNA/RNA (obiekt, widok, str lub bytes)
+        window: rozmiar okna
+        step: przesunięcie między kolejnymi oknami
+
+    Returns:
+        array('d'): udział G+C w każdym oknie (0.0-1.0)
+    """
+    return _window_stats(_bases(sequence), ['GC'], window, step, lambda count: count / window)
+
+
+def gc_skew(sequence, window, step=1):
+    """
+    Oblicza skośność GC, (G - C) / (G + C), w oknach przesuwnych.
+
+    Returns:
+        array('d'): skośność w każdym oknie (0.0 gdy w oknie nie ma G ani C)
+    """
+    return _skew(_bases(sequence), 'G', 'C', window, step)
+
+
+def at_skew(sequence, window, step=1):
+    """
+    Oblicza skośność AT, (A - T) / (A + T), w oknach przesuwnych.
+    Dla RNA zamiast T liczony jest U.
+
+    Returns:
+        array('d'): skośność w każdym oknie (0.0 gdy w oknie nie ma A ani T/U)
+    """
+    return _skew(_bases(sequence), 'A', 'TU', window, step)
+
+
+def shannon_entropy(sequence, window, step=1):
+    """
+    Oblicza entropię Shannona (w bitach) składu w oknach przesuwnych.
+
+    Działa dla dowolnego alfabetu - także dla białek.
+
+    Args:
+        sequence: sekwencja (obiekt, widok, str lub bytes)
+        window: rozmiar okna
+        step: przesunięcie między kolejnymi oknami
+
+    Returns:
+        array('d'): entropia w każdym oknie
+    """
+    bases = _bases(sequence)
+    log_window = math.log2(window)
+    # c * log2(c) dla każdej możliwej liczby wystąpień w oknie (0 * log2(0) = 0)
+    plogp = [0.0] + [count * math.log2(count) for count in range(1, window + 1)]
+
+    def entropy(*counts):
+        # H = log2(w) - sum(c * log2(c)) / w
+        return max(0.0, log_window - sum(map(plogp.__getitem__, counts)) / window)
+
+    return _window_stats(bases, _alphabet(sequence, bases), window, step, entropy)
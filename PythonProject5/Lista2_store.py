@@ -0,0 +1,268 @@
+from array import array
+
+from PythonProject5.Lista2_zadanie2 import BioSequence, DNASequence, SequenceView
+
+"""
+@author Emilia Romanowska
+
+Źródła:
+- Dokumentacja Python: https://docs.python.org/3/reference/index.html
+- Wsparcie koncepcyjne i techniczne: ChatGPT
+"""
+
+
+class SequenceStore:
+    """
+    Kolumnowy magazyn dużej liczby krótkich sekwencji.
+
+    Zamiast osobnego obiektu na każdy odczyt wszystkie zasady trzymane są
+    w jednym ciągłym buforze, a granice sekwencji w tablicy offsetów.
+    Identyfikatory przechowywane są tak samo - w jednym buforze z offsetami.
+    """
+
+    def __init__(self, sequence_class=DNASequence):
+        """
+        Konstruktor magazynu.
+
+        Args:
+            sequence_class: klasa sekwencji przechowywanych w magazynie
+        """
+        if not (isinstance(sequence_class, type) and issubclass(sequence_class, BioSequence)):
+            raise TypeError("Klasa sekwencji musi dziedziczyć po BioSequence")
+
+        self._sequence_class = sequence_class
+        self._bases = bytearray()
+        self._offsets = array('Q', [0])
+        self._identifiers = bytearray()
+        self._identifier_offsets = array('Q', [0])
+
+    @property
+    def sequence_class(self):
+        """Klasa sekwencji przechowywanych w magazynie."""
+        return self._sequence_class
+
+    def append(self, identifier, data):
+        """
+        Dodaje sekwencję do magazynu.
+
+        Args:
+            identifier: identyfikator sekwencji
+            data: sekwencja znaków (str lub bytes), walidowana jak w BioSequence
+
+        Returns:
+            int: indeks dodanej sekwencji
+        """
+        identifier = BioSequence._check_identifier(identifier)
+        bases = self._sequence_class._normalize(data)
+
+        self._bases += bases
+        self._offsets.append(len(self._bases))
+        self._identifiers += identifier.encode('utf-8')
+        self._identifier_offsets.append(len(self._identifiers))
+        return len(self) - 1
+
+    def add(self, sequence):
+        """
+        Dodaje istniejący obiekt sekwencji (bez ponownej walidacji).
+
+        Args:
+            sequence: sekwencja klasy magazynu
+
+        Returns:
+            int: indeks dodanej sekwencji
+        """
+        if not isinstance(sequence, self._sequence_class):
+            raise TypeError(f"Magazyn przechowuje tylko {self._sequence_class.__name__}")
+
+        self._bases += sequence._buffer
+        self._offsets.append(len(self._bases))
+        self._identifiers += sequence.identifier.encode('utf-8')
+        self._identifier_offsets.append(len(self._identifiers))
+        return len(self) - 1
+
+    def extend(self, items):
+        """
+        Dodaje wiele sekwencji.
+
+        Args:
+            items: iterowalna kolekcja obiektów BioSequence lub par (identyfikator, dane)
+        """
+        for item in items:
+            if isinstance(item, BioSequence):
+                self.add(item)
+            else:
+                self.append(*item)
+
+    def __len__(self):
+        """Zwraca liczbę sekwencji w magazynie."""
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index):
+        """
+        Zwraca lekki rekord dla sekwencji o danym indeksie.
+
+        Args:
+            index: indeks sekwencji (dozwolone ujemne)
+
+        Returns:
+            SequenceRecord: widok na sekwencję w magazynie
+        """
+        if not isinstance(index, int):
+            raise TypeError("Indeks musi być liczbą całkowitą")
+
+        count = len(self)
+        if index < 0:
+            index += count
+        if not (0 <= index < count):
+            raise IndexError(f"Indeks {index} poza zakresem magazynu (0-{count - 1})")
+
+        return SequenceRecord(self, index)
+
+    def __iter__(self):
+        """Iteruje po rekordach magazynu."""
+        for index in range(len(self)):
+            yield SequenceRecord(self, index)
+
+    def identifier(self, index):
+        """Zwraca identyfikator sekwencji o danym indeksie."""
+        start = self._identifier_offsets[index]
+        stop = self._identifier_offsets[index + 1]
+        return self._identifiers[start:stop].decode('utf-8')
+
+    def bases(self, index):
+        """
+        Zwraca memoryview (tylko do odczytu) na zasady sekwencji o danym indeksie.
+
+        Dopóki istnieją takie widoki, bufor nie może rosnąć - append() zgłosi BufferError.
+        """
+        return memoryview(self._bases).toreadonly()[self._offsets[index]:self._offsets[index + 1]]
+
+    def sequence_bytes(self, index):
+        """Zwraca kopię zasad sekwencji o danym indeksie jako bytes."""
+        return bytes(self._bases[self._offsets[index]:self._offsets[index + 1]])
+
+    def sequence_length(self, index):
+        """Zwraca długość sekwencji o danym indeksie."""
+        return self._offsets[index + 1] - self._offsets[index]
+
+    def nbytes(self):
+        """
+        Zwraca liczbę bajtów zajmowanych przez dane magazynu.
+
+        Returns:
+            int: suma rozmiarów bufora zasad, identyfikatorów i tablic offsetów
+        """
+        return (len(self._bases) + len(self._identifiers)
+                + self._offsets.itemsize * len(self._offsets)
+                + self._identifier_offsets.itemsize * len(self._identifier_offsets))
+
+    def bytes_per_read(self):
+        """
+        Zwraca średnią liczbę bajtów przypadającą na jedną sekwencję.
+
+        Returns:
+            float: nbytes() / liczba sekwencji (0.0 dla pustego magazynu)
+        """
+        if not len(self):
+            return 0.0
+        return self.nbytes() / len(self)
+
+
+class SequenceRecord:
+    """
+    Lekki rekord wskazujący sekwencję w SequenceStore.
+
+    Udostępnia ten sam interfejs odczytu co BioSequence (identifier, data,
+    length, wycinki, FASTA, findMotif, complement/transcribe/translate),
+    ale nie przechowuje własnej kopii danych.
+
+    Widoki i wycinki rekordu powstają na kopii odczytu, a nie na buforze
+    magazynu - zachowany wycinek nie blokuje dalszego dodawania sekwencji.
+    """
+
+    __slots__ = ('_store', '_index')
+
+    def __init__(self, store, index):
+        """
+        Konstruktor rekordu.
+
+        Args:
+            store: magazyn, w którym leży sekwencja
+            index: indeks sekwencji w magazynie
+        """
+        self._store = store
+        self._index = index
+
+    @property
+    def identifier(self):
+        """Identyfikator sekwencji."""
+        return self._store.identifier(self._index)
+
+    @property
+    def data(self):
+        """Sekwencja jako string."""
+        return self._store.sequence_bytes(self._index).decode('ascii')
+
+    @property
+    def length(self):
+        """Długość sekwencji."""
+        return self._store.sequence_length(self._index)
+
+    def __len__(self):
+        """Zwraca długość sekwencji."""
+        return self.length
+
+    def __getitem__(self, key):
+        """Zwraca zasadę na pozycji albo widok na fragment sekwencji."""
+        return self.view()[key]
+
+    def __str__(self):
+        """Zwraca reprezentację w formacie FASTA."""
+        return f">{self.identifier}\n{self.data}"
+
+    def _content(self):
+        """Zwraca zasady rekordu jako bytes."""
+        return self._store.sequence_bytes(self._index)
+
+    def __eq__(self, other):
+        """Porównanie z innym rekordem lub sekwencją."""
+        if isinstance(other, SequenceRecord):
+            content = other._content()
+        elif isinstance(other, BioSequence):
+            content = other._buffer
+        else:
+            return NotImplemented
+        return self.identifier == other.identifier and self._content() == content
+
+    def view(self):
+        """Zwraca SequenceView na kopię zasad rekordu (bez eksportu bufora magazynu)."""
+        return SequenceView(self._store.sequence_class, self.identifier, memoryview(self._content()))
+
+    def to_sequence(self):
+        """
+        Tworzy pełny obiekt sekwencji z rekordu.
+
+        Returns:
+            BioSequence: niezależna kopia sekwencji
+        """
+        return self._store.sequence_class._from_buffer(self.identifier, bytearray(self._content()))
+
+    def findMotif(self, motif):
+        """Znajduje pozycję motywu w sekwencji (jak BioSequence.findMotif), bez kopiowania odczytu."""
+        store = self._store
+        start = store._offsets[self._index]
+        position = store._bases.find(store.sequence_class._prepare_motif(motif),
+                                     start, store._offsets[self._index + 1])
+        return position if position == -1 else position - start
+
+    def complement(self):
+        """Zwraca nić komplementarną (tylko dla DNA)."""
+        return self.to_sequence().complement()
+
+    def transcribe(self):
+        """Transkrybuje DNA do RNA."""
+        return self.to_sequence().transcribe()
+
+    def translate(self):
+        """Tłumaczy RNA na białko."""
+        return self.to_sequence().translate()
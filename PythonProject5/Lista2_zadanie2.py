@@ -1,4 +1,8 @@
+import hashlib
+import heapq
 from abc import ABC, abstractmethod
+from collections import Counter, namedtuple
+from itertools import product, takewhile
 
 """
 @author Emilia Romanowska
@@ -8,6 +12,14 @@ from abc import ABC, abstractmethod
 - Wsparcie koncepcyjne i techniczne: ChatGPT 
 """
 
+# Białe znaki usuwane podczas normalizacji
+_WHITESPACE_CHARS = ' \n\t'
+_WHITESPACE_BYTES = _WHITESPACE_CHARS.encode('ascii')
+
+# Rozmiar fragmentu normalizacji - szczyt pamięci to wynik + kilka fragmentów
+_NORMALIZE_CHUNK = 1 << 20
+
+
 # pomysł na użycie klasy abstrakcyjnej z VALID_CHARS = set() - chat.gpt
 # normalizacja danych (upper, replace, strip) i walidacja znaków - chat.gpt 
 # walidacja identifier i data w __init__() - chat.gpt
@@ -17,8 +29,16 @@ class BioSequence(ABC):
     Implementuje wspólne funkcjonalności i definiuje interfejs.
     """
 
+    # Bez __dict__ - przy milionach obiektów liczy się każdy bajt
+    __slots__ = ('identifier', '_storage', '_owns_buffer', '_overlay', '_digest')
+
     # Zbiory dozwolonych znaków
     VALID_CHARS = set()
+    _NORMALIZE_TABLE = bytes(256)
+
+    # Nakładka mutacji migawki może mieć najwyżej length // _OVERLAY_RATIO pozycji,
+    # potem sekwencja dostaje własny bufor (słownik nie zajmie więcej niż kopia)
+    _OVERLAY_RATIO = 64
 
     def __init__(self, identifier, data):
         """
@@ -28,70 +48,244 @@ class BioSequence(ABC):
             identifier: identyfikator sekwencji
             data: sekwencja znaków reprezentująca dane biologiczne
         """
+        # Normalizacja i walidacja danych w jednym przebiegu
+        self.identifier = self._check_identifier(identifier)
+        # Zasady trzymamy w buforze bytearray - mutacje są wtedy O(1)
+        self._storage = self._normalize(data)
+        # False gdy bufor jest współdzielony z migawką - zapisy trafiają wtedy do nakładki
+        self._owns_buffer = True
+        self._overlay = None
+        self._digest = None
+
+    @staticmethod
+    def _check_identifier(identifier):
+        """Sprawdza identyfikator i zwraca go bez otaczających białych znaków."""
         if not isinstance(identifier, str) or not identifier.strip():
-            raise Exception("Identyfikator musi być niepustym stringiem")
+            raise ValueError("Identyfikator musi być niepustym stringiem")
+        return identifier.strip()
 
-        if not isinstance(data, str):
-            raise Exception("Dane sekwencji muszą być stringiem")
+    def __init_subclass__(cls, **kwargs):
+        """Buduje tablicę translacji normalizującej dla zbioru VALID_CHARS podklasy."""
+        super().__init_subclass__(**kwargs)
+        # Dozwolone znaki (także małe litery) -> wielka litera, pozostałe bajty -> 0
+        table = bytearray(256)
+        for char in cls.VALID_CHARS:
+            table[ord(char)] = ord(char)
+            table[ord(char.lower())] = ord(char)
+        cls._NORMALIZE_TABLE = bytes(table)
 
-        # Normalizacja danych
-        normalized_data = data.upper().replace(' ', '').replace('\n', '').replace('\t', '')
+    @classmethod
+    def _normalize(cls, data):
+        """
+        Normalizuje i waliduje dane sekwencji w jednym przebiegu na bajtach.
 
-        # Walidacja znaków
-        self._validate_sequence(normalized_data)
+        Dane przetwarzane są fragmentami po _NORMALIZE_CHUNK znaków: każdy
+        fragment jest kodowany do ASCII, a jedno wywołanie bytes.translate()
+        zamienia małe litery na wielkie, usuwa białe znaki i oznacza
+        niedozwolone znaki bajtem zerowym. Wynik trafia do jednego, z góry
+        zaalokowanego bufora, więc obok danych wejściowych w pamięci jest
+        tylko wynik i bieżący fragment.
 
-        self.identifier = identifier.strip()
-        self.data = normalized_data
-        self.length = len(self.data)
+        Args:
+            data: str lub obiekt bajtowy z sekwencją
 
-    def _validate_sequence(self, data):
-        """Waliduje czy wszystkie znaki w sekwencji są dozwolone."""
-        if not data:
-            raise Exception("Sekwencja nie może być pusta")
+        Returns:
+            bytearray: znormalizowana sekwencja
+        """
+        if isinstance(data, str):
+            source = data
+        elif isinstance(data, (bytes, bytearray, memoryview)):
+            source = memoryview(data).cast('B')
+        else:
+            raise TypeError("Dane sekwencji muszą być stringiem")
 
-        invalid_chars = set(data) - self.VALID_CHARS
-        if invalid_chars:
-            raise Exception(f"Nieprawidłowe znaki w sekwencji: {invalid_chars}")
+        buffer = bytearray(len(source))
+        written = 0
+        for start in range(0, len(source), _NORMALIZE_CHUNK):
+            chunk = source[start:start + _NORMALIZE_CHUNK]
+            if isinstance(chunk, str):
+                try:
+                    chunk = chunk.encode('ascii')
+                except UnicodeEncodeError as e:
+                    index = start + e.start
+                    position = index - sum(data.count(char, 0, index) for char in _WHITESPACE_CHARS)
+                    raise ValueError(
+                        f"Nieprawidłowy znak {data[index]!r} na pozycji {position}"
+                    ) from None
+            else:
+                chunk = chunk.tobytes()
+            chunk = chunk.translate(cls._NORMALIZE_TABLE, _WHITESPACE_BYTES)
+            buffer[written:written + len(chunk)] = chunk
+            written += len(chunk)
+
+        # Usunięte białe znaki zostawiają wolne miejsce na końcu bufora
+        del buffer[written:]
+        cls._validate_sequence(buffer, data)
+        return buffer
+
+    @classmethod
+    def _validate_sequence(cls, buffer, data):
+        """Sprawdza znormalizowany bufor i zgłasza pierwszą niedozwoloną pozycję."""
+        if not buffer:
+            raise ValueError("Sekwencja nie może być pusta")
+
+        position = buffer.find(0)
+        if position != -1:
+            # Ścieżka błędu - odtwarzamy oryginalny znak tylko dla prefiksu
+            if isinstance(data, str):
+                data = data.encode('ascii')
+            prefix = bytes(data).translate(None, _WHITESPACE_BYTES)
+            char = chr(prefix[position])
+            raise ValueError(f"Nieprawidłowy znak {char!r} na pozycji {position}")
+
+    @classmethod
+    def _from_buffer(cls, identifier, buffer, owns_buffer=True):
+        """
+        Tworzy sekwencję bezpośrednio z gotowego bufora, bez ponownej walidacji.
+
+        Args:
+            identifier: identyfikator sekwencji
+            buffer: bytearray z poprawnymi, znormalizowanymi zasadami
+            owns_buffer: czy sekwencja jest jedynym właścicielem bufora
+
+        Returns:
+            BioSequence: nowa sekwencja danej klasy
+        """
+        sequence = cls.__new__(cls)
+        sequence.identifier = identifier
+        sequence._storage = buffer
+        sequence._owns_buffer = owns_buffer
+        sequence._overlay = None
+        sequence._digest = None
+        return sequence
+
+    @property
+    def _buffer(self):
+        """Bufor z zasadami (mutacje z nakładki migawki są scalane przy pierwszym odczycie)."""
+        if self._overlay:
+            self._flush_overlay()
+        return self._storage
+
+    @property
+    def data(self):
+        """Sekwencja jako string (dekodowana z bufora przy każdym odczycie, bez zapamiętywania)."""
+        return self._buffer.decode('ascii')
+
+    @property
+    def length(self):
+        """Długość sekwencji."""
+        return len(self._storage)
 
     def __str__(self):
         """Zwraca reprezentację w formacie FASTA."""
         return f">{self.identifier}\n{self.data}"
 
-    def mutate(self, position, value):
+    def _check_mutation(self, position, value):
         """
-        Zmienia znak na zadanej pozycji.
+        Sprawdza poprawność pojedynczej mutacji.
 
-        Args:
-            position: pozycja do zmiany (0-indexed)
-            value: nowa wartość
+        Returns:
+            int: kod bajtowy nowej zasady
         """
         if not isinstance(position, int):
-            raise Exception("Pozycja musi być liczbą całkowitą")
+            raise TypeError("Pozycja musi być liczbą całkowitą")
 
         if not (0 <= position < self.length):
-            raise Exception(f"Pozycja {position} poza zakresem sekwencji (0-{self.length - 1})")
+            raise IndexError(f"Pozycja {position} poza zakresem sekwencji (0-{self.length - 1})")
 
         if not isinstance(value, str) or len(value) != 1:
-            raise Exception("Wartość musi być pojedynczym znakiem")
+            raise ValueError("Wartość musi być pojedynczym znakiem")
 
         value = value.upper()
         if value not in self.VALID_CHARS:
-            raise Exception(f"Nieprawidłowy znak: {value}. Dozwolone: {self.VALID_CHARS}")
+            raise ValueError(f"Nieprawidłowy znak: {value}. Dozwolone: {self.VALID_CHARS}")
 
-        data_list = list(self.data)
-        data_list[position] = value
-        self.data = ''.join(data_list)
+        return ord(value)
 
-    def findMotif(self, motif):
+    def _flush_overlay(self):
+        """Kopiuje współdzielony bufor i nanosi na kopię mutacje z nakładki."""
+        buffer = bytearray(self._storage)
+        for position, code in self._overlay.items():
+            buffer[position] = code
+        self._storage = buffer
+        self._owns_buffer = True
+        self._overlay = None
+
+    def _write(self, changes):
         """
-        Znajduje pozycję motywu w sekwencji.
+        Zapisuje sprawdzone mutacje.
+
+        Własny bufor zmieniany jest w miejscu. Bufor współdzielony z migawką
+        zostaje nietknięty - zmiany trafiają do nakładki (pozycja -> kod).
 
         Args:
-            motif: szukany motyw
+            changes: iterowalna kolekcja par (pozycja, kod bajtowy zasady)
+        """
+        self._digest = None
+        if self._owns_buffer:
+            buffer = self._storage
+            for position, code in changes:
+                buffer[position] = code
+            return
+
+        if self._overlay is None:
+            self._overlay = {}
+        self._overlay.update(changes)
+        if len(self._overlay) > len(self._storage) // self._OVERLAY_RATIO:
+            self._flush_overlay()
+
+    def mutate(self, position, value):
+        """
+        Zmienia znak na zadanej pozycji w czasie O(1).
+
+        Args:
+            position: pozycja do zmiany (0-indexed)
+            value: nowa wartość
+        """
+        code = self._check_mutation(position, value)
+        self._write(((position, code),))
+
+    def apply_mutations(self, mutations):
+        """
+        Nakłada wiele mutacji naraz (np. warianty z pliku VCF).
+
+        Wszystkie mutacje są najpierw walidowane - przy błędzie sekwencja
+        pozostaje niezmieniona.
+
+        Args:
+            mutations: iterowalna kolekcja par (pozycja, wartość)
+        """
+        checked = [(position, self._check_mutation(position, value)) for position, value in mutations]
+        if checked:
+            self._write(checked)
+
+    def snapshot(self, identifier=None):
+        """
+        Zwraca tanią kopię sekwencji współdzieloną z oryginałem.
+
+        Od tej chwili ani migawka, ani oryginał nie zapisują do wspólnego bufora:
+        mutacje każdej ze stron trafiają do jej własnej nakładki zmienionych
+        pozycji, więc haplotypy z wariantami nadal współdzielą sekwencję
+        referencyjną. Pełna kopia powstaje dopiero przy odczycie całego bufora
+        (np. findMotif, complement) albo gdy nakładka urośnie ponad
+        length // _OVERLAY_RATIO pozycji.
+
+        Args:
+            identifier: identyfikator kopii (domyślnie taki sam jak oryginału)
 
         Returns:
-            int: pozycja pierwszego wystąpienia motywu
+            BioSequence: migawka sekwencji
         """
+        self._owns_buffer = False
+        copy = self._from_buffer(identifier or self.identifier, self._storage, owns_buffer=False)
+        if self._overlay:
+            copy._overlay = dict(self._overlay)
+        copy._digest = self._digest
+        return copy
+
+    @classmethod
+    def _prepare_motif(cls, motif):
+        """Normalizuje i waliduje motyw, zwraca go jako bytes."""
         if not isinstance(motif, str):
             raise Exception("Motyw musi być stringiem")
 
@@ -100,26 +294,525 @@ class BioSequence(ABC):
             raise Exception("Motyw nie może być pusty")
 
         # Walidacja znaków w motywie - chat.gpt
-        invalid_chars = set(motif) - self.VALID_CHARS
+        invalid_chars = set(motif) - cls.VALID_CHARS
         if invalid_chars:
             raise Exception(f"Nieprawidłowe znaki w motywie: {invalid_chars}")
 
-        return self.data.find(motif)
+        return motif.encode('ascii')
+
+    def findMotif(self, motif):
+        """
+        Znajduje pozycję motywu w sekwencji.
+
+        Args:
+            motif: szukany motyw
+
+        Returns:
+            int: pozycja pierwszego wystąpienia motywu
+        """
+        return self._buffer.find(self._prepare_motif(motif))
+
+    def findMotifApprox(self, motif, max_distance, metric='edit'):
+        """
+        Znajduje wszystkie przybliżone wystąpienia motywu.
+
+        Dla odległości edycyjnej używany jest bitowo-równoległy algorytm Myersa
+        (motyw dowolnej długości - maska bitowa to liczba int Pythona, więc
+        motywy dłuższe niż 64 znaki obsługiwane są jak wiele słów maszynowych).
+        Dla odległości Hamminga kandydaci wyszukiwani są szybko zasadą
+        szufladkową: przy k błędach co najmniej jeden z k + 1 fragmentów
+        motywu występuje dokładnie.
+
+        Każde wystąpienie zgłaszane jest raz: dla odległości edycyjnej z ciągu
+        sąsiednich końców dopasowania wybierane są lokalne minima odległości.
+
+        Args:
+            motif: szukany motyw
+            max_distance: maksymalna liczba błędów k
+            metric: 'edit' (podstawienia, wstawienia, usunięcia) lub 'hamming'
+
+        Yields:
+            MotifHit: (pozycja początku trafienia, odległość)
+        """
+        pattern = self._prepare_motif(motif)
+        if not isinstance(max_distance, int) or max_distance < 0:
+            raise ValueError("Maksymalna odległość musi być nieujemną liczbą całkowitą")
+
+        if metric == 'hamming':
+            return _hamming_search(pattern, self._buffer, max_distance)
+        if metric == 'edit':
+            return _edit_search(pattern, self._buffer, max_distance)
+        raise ValueError(f"Nieznana metryka: {metric}. Dozwolone: 'edit', 'hamming'")
 
     def __len__(self):
         """Zwraca długość sekwencji."""
-        return self.length
+        return len(self._storage)
+
+    def __getitem__(self, key):
+        """
+        Zwraca zasadę na pozycji albo widok na fragment sekwencji.
+
+        Args:
+            key: indeks (int) lub wycinek (slice)
+
+        Returns:
+            str dla indeksu, SequenceView dla wycinka (bez kopiowania danych)
+        """
+        if isinstance(key, slice):
+            if self._overlay:
+                return self._overlay_slice(key)
+            return self.view()[key]
+        storage = self._storage
+        if self._overlay:
+            # Odczyt pojedynczej zasady nie wymusza scalenia nakładki
+            position = range(len(storage))[key]
+            return chr(self._overlay.get(position, storage[position]))
+        return chr(storage[key])
+
+    def _overlay_slice(self, key):
+        """
+        Tworzy widok na wycinek sekwencji z niescaloną nakładką.
+
+        Kopiowany jest tylko zakres wycinka (z naniesionymi mutacjami nakładki
+        z tego zakresu) - nakładka nie jest scalana, więc naprzemienne mutacje
+        i wycinki nie kopiują całej sekwencji.
+        """
+        storage = self._storage
+        start, stop, step = key.indices(len(storage))
+        positions = range(start, stop, step)
+        if positions:
+            low, high = min(positions[0], positions[-1]), max(positions[0], positions[-1]) + 1
+        else:
+            low = high = start
+        buffer = bytearray(memoryview(storage)[low:high])
+        for position, code in self._overlay.items():
+            if low <= position < high:
+                buffer[position - low] = code
+        # Skrajne pozycje wycinka to granice kopii, więc wystarczy sam krok
+        return SequenceView(type(self), f"{self.identifier}[{_slice_bounds(start, stop, step)}]",
+                            memoryview(buffer).toreadonly()[::step])
+
+    def view(self):
+        """
+        Zwraca widok tylko do odczytu na całą sekwencję, współdzielący jej bufor.
+
+        Widok jest stabilny: bufor zostaje oznaczony jako współdzielony, więc
+        późniejsze mutacje sekwencji trafiają do nakładki (jak po snapshot())
+        i nie są w widoku widoczne.
+
+        Returns:
+            SequenceView: widok na sekwencję
+        """
+        buffer = self._buffer
+        self._owns_buffer = False
+        return SequenceView(type(self), self.identifier, memoryview(buffer).toreadonly())
 
     def __eq__(self, other):
         """Porównanie sekwencji."""
         if not isinstance(other, BioSequence):
+            # Pozwalamy drugiej stronie (np. SequenceRecord) porównać się samodzielnie
+            return NotImplemented
+        # Różne zapamiętane skróty oznaczają różną treść - bez porównywania buforów
+        if self._digest is not None and other._digest is not None and self._digest != other._digest:
             return False
-        return self.data == other.data and self.identifier == other.identifier
+        return self._buffer == other._buffer and self.identifier == other.identifier
+
+    def content_digest(self):
+        """
+        Zwraca skrót (BLAKE2b, 16 bajtów) zawartości sekwencji.
+
+        Skrót liczony jest raz i zapamiętywany do następnej mutacji, więc może
+        służyć jako klucz słownika przy deduplikacji w czasie O(1).
 
+        Returns:
+            bytes: skrót zasad sekwencji (bez identyfikatora)
+        """
+        if self._digest is None:
+            self._digest = hashlib.blake2b(self._buffer, digest_size=16).digest()
+        return self._digest
+
+
+# Trafienie przybliżonego wyszukiwania motywu
+MotifHit = namedtuple('MotifHit', ['position', 'distance'])
+
+
+def _myers(pattern, text, max_distance, anchored=False):
+    """
+    Bitowo-równoległy algorytm Myersa (wariant Hyyrö).
+
+    Kolumna macierzy programowania dynamicznego zapisana jest jako wektory
+    bitowe różnic pionowych; jedna zasada tekstu to kilka operacji bitowych.
+
+    Args:
+        pattern: motyw (bytes)
+        text: tekst (obiekt bajtowy)
+        max_distance: maksymalna odległość
+        anchored: czy dopasowanie musi zaczynać się na początku tekstu
+
+    Yields:
+        tuple: (indeks ostatniej zasady dopasowania, odległość)
+    """
+    length = len(pattern)
+    mask = (1 << length) - 1
+    high = 1 << (length - 1)
+    # Przy zakotwiczeniu górny wiersz macierzy rośnie o 1 na każdą zasadę tekstu
+    carry = 1 if anchored else 0
+
+    peq = [0] * 256
+    for i, code in enumerate(pattern):
+        peq[code] |= 1 << i
+
+    pv, mv, score = mask, 0, length
+    for j, code in enumerate(text):
+        eq = peq[code]
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+        ph = mv | (~(xh | pv) & mask)
+        mh = pv & xh
+        if ph & high:
+            score += 1
+        elif mh & high:
+            score -= 1
+        ph = ((ph << 1) | carry) & mask
+        mh = (mh << 1) & mask
+        pv = mh | (~(xv | ph) & mask)
+        mv = ph & xv
+        if score <= max_distance:
+            yield j, score
+
+
+def _edit_search(pattern, text, max_distance):
+    """
+    Wyszukiwanie z odległością edycyjną; początek trafienia odtwarzany wstecz.
+
+    Kolejne kolumny końca z odległością <= k opisują zwykle to samo
+    wystąpienie, więc brane są tylko lokalne minima odległości w każdym
+    ciągu takich kolumn (całe plateau równych wartości - to mogą być różne
+    wystąpienia, np. powtórzenia TTTT dla motywu T). Początek odtwarzany
+    jest tylko dla tych kolumn, a kolejne trafienia o tym samym początku
+    łączone są w jedno z najmniejszą odległością.
+    """
+    length = len(pattern)
+    reversed_pattern = pattern[::-1]
+
+    def start_of(end, distance):
+        # Początek: zakotwiczony Myers na odwróconym oknie kończącym się w end
+        window_start = max(0, end + 1 - length - distance)
+        window = bytes(text[window_start:end + 1])[::-1]
+        best = min(_myers(reversed_pattern, window, distance, anchored=True),
+                   key=lambda hit: hit[1])
+        return end - best[0]
+
+    def minima():
+        candidates = []
+        previous = None
+        for end, distance in _myers(pattern, text, max_distance):
+            if previous is not None and end != previous[0] + 1:
+                # Koniec ciągu kolumn - zgłaszamy jego ostatnie minimum
+                yield from candidates
+                candidates = []
+                previous = None
+            if previous is None or distance < previous[1]:
+                candidates = [(end, distance)]
+            elif distance == previous[1]:
+                if candidates:
+                    candidates.append((end, distance))
+            else:
+                yield from candidates
+                candidates = []
+            previous = (end, distance)
+        yield from candidates
+
+    occurrence = None
+    for end, distance in minima():
+        start = start_of(end, distance)
+        if occurrence is not None and start != occurrence.position:
+            yield occurrence
+            occurrence = None
+        if occurrence is None or distance < occurrence.distance:
+            occurrence = MotifHit(start, distance)
+
+    if occurrence is not None:
+        yield occurrence
+
+
+def _occurrences(piece, offset, text, last_start):
+    """Generuje początki motywu wynikające z dokładnych wystąpień jego fragmentu."""
+    position = text.find(piece)
+    while position != -1:
+        start = position - offset
+        if start > last_start:
+            return
+        if start >= 0:
+            yield start
+        position = text.find(piece, position + 1)
+
+
+def _hamming_search(pattern, text, max_distance):
+    """Wyszukiwanie z odległością Hamminga z filtrem szufladkowym."""
+    length = len(pattern)
+    last_start = len(text) - length
+    if last_start < 0:
+        return
+
+    pieces = max_distance + 1
+    if pieces > length:
+        candidates = range(last_start + 1)
+    else:
+        size = length // pieces
+        bounds = [i * size for i in range(pieces)] + [length]
+        candidates = heapq.merge(*(_occurrences(pattern[a:b], a, text, last_start)
+                                   for a, b in zip(bounds, bounds[1:])))
+
+    previous = -1
+    for start in candidates:
+        if start == previous:
+            continue
+        previous = start
+        distance = 0
+        for a, b in zip(pattern, text[start:start + length]):
+            if a != b:
+                distance += 1
+                if distance > max_distance:
+                    break
+        else:
+            yield MotifHit(start, distance)
+
+
+def _slice_bounds(start, stop, step):
+    """Zapis granic wycinka (po slice.indices()) używany w identyfikatorach widoków."""
+    # Przy ujemnym kroku stop == -1 oznacza "do początku" - pomijamy go
+    stop = '' if stop < 0 else stop
+    return f"{start}:{stop}" if step == 1 else f"{start}:{stop}:{step}"
+
+
+class SequenceView:
+    """
+    Lekki widok na sekwencję lub jej fragment, działający bez kopiowania danych.
 
-class DNASequence(BioSequence):
+    Zasady czytane są przez memoryview ze wspólnego bufora. Opcjonalna tablica
+    translacji (np. komplementarność, transkrypcja) stosowana jest leniwie
+    przy dostępie do zasad - pełna sekwencja powstaje dopiero w materialize().
+    Widok pokazuje sekwencję z chwili utworzenia - jej późniejsze mutacje
+    nie są w nim widoczne.
+    """
+
+    __slots__ = ('identifier', '_sequence_class', '_view', '_table')
+
+    def __init__(self, sequence_class, identifier, view, table=None):
+        """
+        Konstruktor widoku.
+
+        Args:
+            sequence_class: klasa sekwencji, którą widok reprezentuje
+            identifier: identyfikator widoku
+            view: memoryview na bufor z zasadami
+            table: opcjonalna 256-bajtowa tablica translacji zasad
+        """
+        self.identifier = identifier
+        self._sequence_class = sequence_class
+        self._view = view
+        self._table = table
+
+    def __len__(self):
+        """Zwraca długość widoku (bez materializacji)."""
+        return len(self._view)
+
+    def __getitem__(self, key):
+        """
+        Zwraca zasadę na pozycji albo widok na węższy fragment.
+
+        Args:
+            key: indeks (int) lub wycinek (slice)
+        """
+        if isinstance(key, slice):
+            bounds = _slice_bounds(*key.indices(len(self._view)))
+            return SequenceView(self._sequence_class, f"{self.identifier}[{bounds}]",
+                                self._view[key], self._table)
+
+        code = self._view[key]
+        if self._table is not None:
+            code = self._table[code]
+        return chr(code)
+
+    def __iter__(self):
+        """Iteruje po zasadach widoku, tłumacząc je na bieżąco."""
+        table = self._table
+        for code in self._view:
+            yield chr(code if table is None else table[code])
+
+    def __str__(self):
+        """Zwraca reprezentację w formacie FASTA."""
+        return f">{self.identifier}\n{self.data}"
+
+    @property
+    def sequence_class(self):
+        """Klasa sekwencji, którą reprezentuje widok."""
+        return self._sequence_class
+
+    @property
+    def data(self):
+        """Zasady widoku jako string (wymusza odczyt całego fragmentu)."""
+        return self.tobytes().decode('ascii')
+
+    def tobytes(self):
+        """Zwraca zasady widoku jako bytes."""
+        data = self._view.tobytes()
+        if self._table is not None:
+            data = data.translate(self._table)
+        return data
+
+    def materialize(self, identifier=None):
+        """
+        Tworzy niezależną sekwencję z zawartości widoku.
+
+        Args:
+            identifier: identyfikator nowej sekwencji (domyślnie identyfikator widoku)
+
+        Returns:
+            BioSequence: sekwencja klasy reprezentowanej przez widok
+        """
+        if not len(self._view):
+            raise ValueError("Nie można utworzyć sekwencji z pustego widoku")
+        buffer = bytearray(self._view)
+        if self._table is not None:
+            buffer = buffer.translate(self._table)
+        return self._sequence_class._from_buffer(identifier or self.identifier, buffer)
+
+    def _derive(self, table, sequence_class, suffix):
+        """Tworzy leniwy widok złożony z bieżącej i nowej tablicy translacji."""
+        if self._table is not None:
+            # Złożenie tablic: najpierw bieżąca translacja, potem nowa
+            table = self._table.translate(table)
+        return SequenceView(sequence_class, f"{self.identifier}{suffix}", self._view, table)
+
+    def complement_view(self):
+        """
+        Zwraca leniwy widok nici komplementarnej.
+
+        Returns:
+            SequenceView: widok komplementarnej sekwencji DNA
+        """
+        if not issubclass(self._sequence_class, DNASequence):
+            raise TypeError("Nić komplementarna dostępna jest tylko dla DNA")
+        return self._derive(DNASequence._COMPLEMENT_TABLE, DNASequence, "_complement")
+
+    def transcribe_view(self):
+        """
+        Zwraca leniwy widok transkryptu RNA.
+
+        Returns:
+            SequenceView: widok sekwencji RNA
+        """
+        if not issubclass(self._sequence_class, DNASequence):
+            raise TypeError("Transkrypcja dostępna jest tylko dla DNA")
+        return self._derive(DNASequence._TRANSCRIPTION_TABLE, RNASequence, "_RNA")
+
+
+class NucleicAcidSequence(BioSequence):
+    """
+    Wspólna baza dla sekwencji DNA i RNA.
+
+    Dostarcza zliczanie k-merów z kroczącym haszem 2-bitowym
+    (A=0, C=1, G=2, T/U=3).
+    """
+
+    __slots__ = ()
+
+    # Kodowanie 2-bitowe zasad jako tablica translacji
+    _TWO_BIT_TABLE = bytes.maketrans(b'ACGTU', bytes([0, 1, 2, 3, 3]))
+
+    # Litery odpowiadające kodom 0-3 (nadpisywane w podklasach)
+    _TWO_BIT_ALPHABET = 'ACGT'
+
+    def kmer_iter(self, k, canonical=False):
+        """
+        Generuje kolejne k-mery sekwencji jako liczby (kodowanie 2-bitowe).
+
+        Hasz jest kroczący - każda kolejna zasada kosztuje O(1) niezależnie od k.
+        Niepoprawne k zgłaszane jest od razu przy wywołaniu, a nie przy
+        pierwszej iteracji.
+
+        Args:
+            k: długość k-meru
+            canonical: czy zwracać k-mer kanoniczny (mniejszy z k-meru
+                i jego odwrotnego komplementu)
+
+        Returns:
+            iterator int: kody k-merów, kolejno od pozycji 0
+        """
+        if not isinstance(k, int) or k < 1:
+            raise ValueError("Długość k-meru musi być dodatnią liczbą całkowitą")
+        return self._kmer_codes(k, canonical)
+
+    def _kmer_codes(self, k, canonical):
+        """Generator k-merów dla kmer_iter() (argumenty już sprawdzone)."""
+        codes = self._buffer.translate(self._TWO_BIT_TABLE)
+        mask = (1 << (2 * k)) - 1
+        code = 0
+
+        if not canonical:
+            for i, base in enumerate(codes):
+                code = ((code << 2) | base) & mask
+                if i >= k - 1:
+                    yield code
+            return
+
+        # Odwrotny komplement budujemy od drugiej strony: komplement zasady b to 3 - b
+        shift = 2 * (k - 1)
+        reverse = 0
+        for i, base in enumerate(codes):
+            code = ((code << 2) | base) & mask
+            reverse = (reverse >> 2) | ((3 - base) << shift)
+            if i >= k - 1:
+                yield code if code < reverse else reverse
+
+    def __init_subclass__(cls, **kwargs):
+        """Buduje tablicę dekodowania k-merów dla alfabetu podklasy."""
+        super().__init_subclass__(**kwargs)
+        # Cyfra szesnastkowa = 4 bity = 2 zasady
+        alphabet = cls._TWO_BIT_ALPHABET
+        cls._HEX_DECODE_TABLE = {ord(digit): alphabet[value >> 2] + alphabet[value & 3]
+                                 for value, digit in enumerate('0123456789abcdef')}
+
+    @classmethod
+    def decode_kmer(cls, code, k):
+        """
+        Zamienia kod k-meru z powrotem na string.
+
+        Args:
+            code: kod k-meru zwrócony przez kmer_iter()
+            k: długość k-meru
+
+        Returns:
+            str: k-mer
+        """
+        bases = format(code, f'0{(k + 1) // 2}x').translate(cls._HEX_DECODE_TABLE)
+        return bases[len(bases) - k:]
+
+    def kmer_counts(self, k, canonical=False, encoded=False):
+        """
+        Zlicza k-mery sekwencji.
+
+        Args:
+            k: długość k-meru
+            canonical: czy zliczać k-mery kanoniczne
+            encoded: czy zostawić klucze jako kody liczbowe (bez kosztu dekodowania)
+
+        Returns:
+            Counter: liczba wystąpień każdego k-meru (klucze jako stringi lub kody)
+        """
+        counts = Counter(self.kmer_iter(k, canonical))
+        if encoded:
+            return counts
+        return Counter({self.decode_kmer(code, k): count for code, count in counts.items()})
+
+
+class DNASequence(NucleicAcidSequence):
     """Klasa reprezentująca sekwencję DNA."""
 
+    __slots__ = ()
+
     VALID_CHARS = {'A', 'T', 'G', 'C'}
 
     # Mapowanie komplementarności zasad DNA
@@ -128,6 +821,12 @@ class DNASequence(BioSequence):
     # Mapowanie transkrypcji DNA -> RNA
     TRANSCRIPTION_MAP = {'A': 'A', 'T': 'U', 'G': 'G', 'C': 'C'}
 
+    # Te same mapowania jako tablice translacji dla bytes.translate()
+    _COMPLEMENT_TABLE = bytes.maketrans(''.join(COMPLEMENT_MAP).encode('ascii'),
+                                        ''.join(COMPLEMENT_MAP.values()).encode('ascii'))
+    _TRANSCRIPTION_TABLE = bytes.maketrans(''.join(TRANSCRIPTION_MAP).encode('ascii'),
+                                           ''.join(TRANSCRIPTION_MAP.values()).encode('ascii'))
+
     def complement(self):
         """
         Zwraca nić komplementarną do sekwencji DNA.
@@ -135,9 +834,8 @@ class DNASequence(BioSequence):
         Returns:
             DNASequence: komplementarna sekwencja DNA
         """
-        #Sposób zapisu z użyciem generatora w ''.join(...) - chat.gpt
-        complement_data = ''.join(self.COMPLEMENT_MAP[base] for base in self.data)
-        return DNASequence(f"{self.identifier}_complement", complement_data)
+        complement_data = self._buffer.translate(self._COMPLEMENT_TABLE)
+        return DNASequence._from_buffer(f"{self.identifier}_complement", complement_data)
 
     def transcribe(self):
         """
@@ -146,16 +844,37 @@ class DNASequence(BioSequence):
         Returns:
             RNASequence: sekwencja RNA powstała z transkrypcji
         """
-        #Sposób zapisu z użyciem generatora w ''.join(...) - chat.gpt
-        rna_data = ''.join(self.TRANSCRIPTION_MAP[base] for base in self.data)
-        return RNASequence(f"{self.identifier}_RNA", rna_data)
+        rna_data = self._buffer.translate(self._TRANSCRIPTION_TABLE)
+        return RNASequence._from_buffer(f"{self.identifier}_RNA", rna_data)
 
+    def complement_view(self):
+        """
+        Zwraca leniwy widok nici komplementarnej (bez kopiowania danych).
+
+        Returns:
+            SequenceView: widok komplementarnej sekwencji DNA
+        """
+        return self.view().complement_view()
 
-class RNASequence(BioSequence):
+    def transcribe_view(self):
+        """
+        Zwraca leniwy widok transkryptu RNA (bez kopiowania danych).
+
+        Returns:
+            SequenceView: widok sekwencji RNA
+        """
+        return self.view().transcribe_view()
+
+
+class RNASequence(NucleicAcidSequence):
     """Klasa reprezentująca sekwencję RNA."""
 
+    __slots__ = ()
+
     VALID_CHARS = {'A', 'U', 'G', 'C'}
 
+    _TWO_BIT_ALPHABET = 'ACGU'
+
     # Kod genetyczny
     GENETIC_CODE = {
         'UUU': 'F', 'UUC': 'F', 'UUA': 'L', 'UUG': 'L',
@@ -176,6 +895,10 @@ class RNASequence(BioSequence):
         'GGU': 'G', 'GGC': 'G', 'GGA': 'G', 'GGG': 'G'
     }
 
+    # Kod genetyczny jako tablica 64 bajtów indeksowana kodem 2-bitowym kodonu (16a + 4b + c)
+    _CODON_TABLE = ''.join(map(GENETIC_CODE.__getitem__,
+                               map(''.join, product(_TWO_BIT_ALPHABET, repeat=3)))).encode('ascii')
+
     def translate(self):
         """
         Tłumaczy RNA na białko.
@@ -183,28 +906,27 @@ class RNASequence(BioSequence):
         Returns:
             ProteinSequence: sekwencja białka powstała z translacji
         """
-        if len(self.data) % 3 != 0:
+        buffer = self._buffer
+        if len(buffer) % 3 != 0:
             raise ValueError("Długość sekwencji RNA musi być wielokrotnością 3 dla prawidłowej translacji")
 
-        protein_data = []
-
-        # Czytamy kodony (po 3 nukleotydy)
-        for i in range(0, len(self.data), 3):
-            codon = self.data[i:i + 3]
-            amino_acid = self.GENETIC_CODE.get(codon, 'X')  # X dla nieznanych kodonów
+        # Czytamy kodony (po 3 nukleotydy) prosto z bufora, jako kody 2-bitowe
+        codes = buffer.translate(self._TWO_BIT_TABLE)
+        table = self._CODON_TABLE
+        amino_acids = (table[(first << 4) | (second << 2) | third]
+                       for first, second, third in zip(codes[0::3], codes[1::3], codes[2::3]))
 
-            # Zatrzymujemy translację na kodonie stop (*) - chat.gpt
-            if amino_acid == '*':
-                break
+        # Zatrzymujemy translację na kodonie stop (*) - chat.gpt
+        protein_data = bytes(takewhile(ord('*').__ne__, amino_acids))
 
-            protein_data.append(amino_acid)
-
-        return ProteinSequence(f"{self.identifier}_protein", ''.join(protein_data))
+        return ProteinSequence(f"{self.identifier}_protein", protein_data)
 
 
 class ProteinSequence(BioSequence):
     """Klasa reprezentująca sekwencję białka."""
 
+    __slots__ = ()
+
     # Standardowe 20 aminokwasów + kodony stop i nieznane
     VALID_CHARS = {
         'A', 'R', 'N', 'D', 'C', 'E', 'Q', 'G', 'H', 'I',
@@ -213,6 +935,117 @@ class ProteinSequence(BioSequence):
     }
 
 
+class _FastaParser:
+    """
+    Stan parsera FASTA karmionego linia po linii.
+
+    Wspólny dla read_fasta() i asynchronicznego read_fasta_async() - źródło
+    linii może być zwykłym iteratorem albo strumieniem asyncio.
+    """
+
+    __slots__ = ('sequence_class', 'identifier', 'chunks')
+
+    def __init__(self, sequence_class):
+        """
+        Konstruktor parsera.
+
+        Args:
+            sequence_class: klasa tworzonych sekwencji
+        """
+        self.sequence_class = sequence_class
+        self.identifier = None
+        self.chunks = []
+
+    def feed(self, line):
+        """
+        Przetwarza jedną linię pliku.
+
+        Returns:
+            BioSequence: sekwencja zakończona nagłówkiem w tej linii albo None
+        """
+        line = line.strip()
+        if line.startswith('>'):
+            sequence = self.finish()
+            self.identifier = line[1:]
+            return sequence
+        if line:
+            if self.identifier is None:
+                raise ValueError("Plik FASTA musi zaczynać się od nagłówka '>'")
+            self.chunks.append(line)
+        return None
+
+    def finish(self):
+        """
+        Kończy bieżącą sekwencję.
+
+        Returns:
+            BioSequence: ostatnia sekwencja albo None, gdy nie było nagłówka
+        """
+        if self.identifier is None:
+            return None
+        sequence = self.sequence_class(self.identifier, ''.join(self.chunks))
+        self.identifier = None
+        self.chunks = []
+        return sequence
+
+
+def read_fasta(lines, sequence_class=DNASequence):
+    """
+    Wczytuje sekwencje z pliku FASTA (odwrotność BioSequence.__str__).
+
+    Args:
+        lines: iterowalna kolekcja linii (np. otwarty plik)
+        sequence_class: klasa tworzonych sekwencji
+
+    Yields:
+        BioSequence: kolejne sekwencje z pliku
+    """
+    parser = _FastaParser(sequence_class)
+    for line in lines:
+        sequence = parser.feed(line)
+        if sequence is not None:
+            yield sequence
+
+    sequence = parser.finish()
+    if sequence is not None:
+        yield sequence
+
+
+def merge_kmer_counts(sequences, k, canonical=False, encoded=False):
+    """
+    Zlicza k-mery strumieniowo w wielu sekwencjach naraz.
+
+    Liczniki trzymane są na kodach liczbowych, a na stringi zamieniane
+    dopiero na końcu, więc pamięć zależy od liczby różnych k-merów,
+    a nie od liczby sekwencji. Mieszanka DNA i RNA dozwolona jest tylko
+    z encoded=True - inaczej k-mery nie dałyby się jednoznacznie zdekodować.
+
+    Args:
+        sequences: iterowalna kolekcja sekwencji DNA lub RNA (jednego rodzaju,
+            chyba że encoded=True)
+        k: długość k-meru
+        canonical: czy zliczać k-mery kanoniczne
+        encoded: czy zostawić klucze jako kody liczbowe
+
+    Returns:
+        Counter: łączna liczba wystąpień każdego k-meru
+    """
+    counts = Counter()
+    sequence_class = None
+    for sequence in sequences:
+        if not isinstance(sequence, NucleicAcidSequence):
+            raise TypeError("K-mery można liczyć tylko dla sekwencji DNA i RNA")
+        if sequence_class is None:
+            sequence_class = type(sequence)
+        elif not encoded and sequence._TWO_BIT_ALPHABET != sequence_class._TWO_BIT_ALPHABET:
+            raise TypeError("Nie można łączyć k-merów DNA i RNA bez encoded=True")
+        counts.update(sequence.kmer_iter(k, canonical))
+
+    if encoded or sequence_class is None:
+        return counts
+    return Counter({sequence_class.decode_kmer(code, k): count for code, count in counts.items()})
+
+
 if __name__ == "__main__":
 
     # DNA